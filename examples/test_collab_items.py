@@ -25,58 +25,12 @@ Authentication can be supplied via args, environment variables, or config:
 from __future__ import annotations
 
 import argparse
-import json
-import os
 from typing import Optional
 
-from arcgis.gis import GIS
-
-from mygis_core import config as config_mod
-from mygis_core import log as log_mod
+from mygis_core.cli import add_perf_args, build_gis, configure_from_args, dump_json
 from mygis_core.collab import compare_feature_service_items
 
 
-def _configure_logging_and_load_config(args) -> config_mod.Config:
-    paths = [args.config] if args.config else None
-    cfg = config_mod.load_config(paths=paths, env_override=not args.no_env_override)
-    level = args.log_level or cfg.get("log_level")
-    fmt = args.log_format or cfg.get("log_format")
-    file = args.log_file or cfg.get("log_file")
-    json_format: Optional[bool] = None if fmt is None else str(fmt).lower() == "json"
-    log_mod.configure_logging(level=level, json_format=json_format, file=file)
-    return cfg
-
-
-def _gis_from_args_env(prefix: str, args, cfg: config_mod.Config) -> GIS:
-    pfx = prefix.lower()
-    # 1) profile
-    profile = getattr(args, f"{pfx}_profile", None) or os.environ.get(f"MYGIS_{pfx.upper()}_PROFILE") or cfg.get(f"{pfx}_profile")
-    if profile:
-        return GIS(profile=str(profile))
-
-    # 2) explicit portal credentials
-    portal = (
-        getattr(args, f"{pfx}_portal", None)
-        or os.environ.get(f"MYGIS_{pfx.upper()}_PORTAL_URL")
-        or os.environ.get(f"MYGIS_{pfx.upper()}_PORTAL")
-        or cfg.get(f"{pfx}_portal_url")
-        or cfg.get(f"{pfx}_portal")
-    )
-    username = getattr(args, f"{pfx}_username", None) or os.environ.get(f"MYGIS_{pfx.upper()}_USERNAME") or cfg.get(f"{pfx}_username")
-    password = getattr(args, f"{pfx}_password", None) or os.environ.get(f"MYGIS_{pfx.upper()}_PASSWORD") or cfg.get(f"{pfx}_password")
-
-    if portal and username and password:
-        return GIS(str(portal), str(username), str(password))
-
-    # 3) fallback: Pro/Home
-    auth = getattr(args, f"{pfx}_auth", None) or cfg.get(f"{pfx}_auth", None)
-    if auth:
-        return GIS(str(auth))
-
-    # Last resort
-    return GIS("pro")
-
-
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Test compare_feature_service_items across two portals")
     p.add_argument("--host-item", dest="host_item", required=True, help="Host Feature Service item ID")
@@ -98,12 +52,14 @@ def build_parser() -> argparse.ArgumentParser:
 
     p.add_argument("--json", action="store_true", help="Print full result JSON to stdout")
     p.add_argument("--quiet", action="store_true", help="Suppress info logs")
+    p.add_argument("--deep", action="store_true", help="Always query layer counts, even when editingInfo matches")
+    add_perf_args(p)
 
     # Logging + config common flags
     p.add_argument("--log-level", dest="log_level", help="Set log level (DEBUG, INFO, WARNING, ERROR)")
     p.add_argument("--log-format", dest="log_format", choices=["plain", "json"], help="Log output format")
     p.add_argument("--log-file", dest="log_file", help="Write logs to file path")
-    p.add_argument("--config", dest="config", help="Config file path (toml/yaml/json/ini/.env)")
+    p.add_argument("--config", dest="config_path", help="Config file path (toml/yaml/json/ini/.env)")
     p.add_argument("--no-env-override", action="store_true", help="Do not let env vars override file/defaults")
     return p
 
@@ -111,14 +67,22 @@ def build_parser() -> argparse.ArgumentParser:
 def main(argv: Optional[list[str]] = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
-    cfg = _configure_logging_and_load_config(args)
-
-    host_gis = _gis_from_args_env("host", args, cfg)
-    guest_gis = _gis_from_args_env("guest", args, cfg)
-
-    res = compare_feature_service_items(host_gis, guest_gis, args.host_item, args.guest_item, verbose=not args.quiet)
+    cfg = configure_from_args(args)
+
+    host_gis = build_gis("host", args, cfg)
+    guest_gis = build_gis("guest", args, cfg)
+
+    res = compare_feature_service_items(
+        host_gis,
+        guest_gis,
+        args.host_item,
+        args.guest_item,
+        verbose=not args.quiet,
+        deep=args.deep,
+        max_workers=args.max_workers,
+    )
     if args.json:
-        print(json.dumps(res, ensure_ascii=False))
+        dump_json(res)
     else:
         status = res.get("status")
         title = res.get("title")
@@ -15,75 +15,28 @@ CLI, environment variables (MYGIS_HOST_*, MYGIS_GUEST_*), or config files.
 from __future__ import annotations
 
 import argparse
-import json
-import os
+import io
+import re
+import sys
 from typing import Optional
 
-from arcgis.gis import GIS
-
-from mygis_core import config as config_mod
-from mygis_core import log as log_mod
+from mygis_core.cli import add_perf_args, build_gis, configure_from_args, dump_json
 from mygis_core.collab import compare_feature_service_records
 
 
-def _configure_logging_and_load_config(args) -> config_mod.Config:
-    paths = [args.config] if args.config else None
-    cfg = config_mod.load_config(paths=paths, env_override=not args.no_env_override)
-    level = args.log_level or cfg.get("log_level")
-    fmt = args.log_format or cfg.get("log_format")
-    file = args.log_file or cfg.get("log_file")
-    json_format: Optional[bool] = None if fmt is None else str(fmt).lower() == "json"
-    log_mod.configure_logging(level=level, json_format=json_format, file=file)
-    return cfg
-
-
-def _gis_from_args_env(prefix: str, args, cfg: config_mod.Config) -> GIS:
-    pfx = prefix.lower()
-    profile = (
-        getattr(args, f"{pfx}_profile", None)
-        or os.environ.get(f"MYGIS_{pfx.upper()}_PROFILE")
-        or cfg.get(f"{pfx}_profile")
-    )
-    if profile:
-        return GIS(profile=str(profile))
-
-    portal = (
-        getattr(args, f"{pfx}_portal", None)
-        or os.environ.get(f"MYGIS_{pfx.upper()}_PORTAL_URL")
-        or os.environ.get(f"MYGIS_{pfx.upper()}_PORTAL")
-        or cfg.get(f"{pfx}_portal_url")
-        or cfg.get(f"{pfx}_portal")
-    )
-    username = (
-        getattr(args, f"{pfx}_username", None)
-        or os.environ.get(f"MYGIS_{pfx.upper()}_USERNAME")
-        or cfg.get(f"{pfx}_username")
-    )
-    password = (
-        getattr(args, f"{pfx}_password", None)
-        or os.environ.get(f"MYGIS_{pfx.upper()}_PASSWORD")
-        or cfg.get(f"{pfx}_password")
-    )
-
-    if portal and username and password:
-        return GIS(str(portal), str(username), str(password))
+# Commas only: layer/field names such as "Water Mains" may contain spaces
+_FIELD_SEP = re.compile(r"\s*,\s*")
 
-    auth = getattr(args, f"{pfx}_auth", None) or cfg.get(f"{pfx}_auth", None)
-    if auth:
-        return GIS(str(auth))
 
-    return GIS("pro")
+def _split_fields(values: Optional[list[str]]) -> list[str]:
+    return [part for value in (values or ()) if value for part in _FIELD_SEP.split(str(value).strip()) if part]
 
 
-def _split_fields(values: Optional[list[str]]) -> list[str]:
-    if not values:
-        return []
-    result: list[str] = []
-    for value in values:
-        if not value:
-            continue
-        result.extend(part for part in str(value).split(",") if part)
-    return [v.strip() for v in result if v.strip()]
+def _row_line(row: dict, maxlen: int = 200) -> str:
+    attrs = repr(row.get("attributes"))
+    if len(attrs) > maxlen:
+        attrs = attrs[:maxlen] + "..."
+    return f"     count={row.get('count')}, attrs={attrs}\n"
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -119,20 +72,33 @@ def build_parser() -> argparse.ArgumentParser:
         help="Limit comparison to specific layer/table keys (matching names)",
     )
     p.add_argument(
-        "--chunk-size",
-        dest="chunk_size",
+        "--concurrency",
+        dest="concurrency",
         type=int,
-        default=2000,
-        help="Pagination size when fetching records (0 to fetch all in one request)",
+        default=1,
+        help="Record pages fetched in parallel per layer (default 1: page sequentially)",
+    )
+    p.add_argument(
+        "--oid-fast-path",
+        dest="oid_fast_path",
+        action="store_true",
+        help="Download only rows whose ObjectID exists on one side (assumes shared IDs hold equal rows)",
+    )
+    p.add_argument(
+        "--no-bulk-pages",
+        dest="bulk_pages",
+        action="store_false",
+        help="Keep --batch-size pages even where the layer allows larger resultType=standard pages",
     )
 
     p.add_argument("--json", action="store_true", help="Print full result JSON to stdout")
     p.add_argument("--quiet", action="store_true", help="Suppress info logs")
+    add_perf_args(p, batch_size=True)
 
     p.add_argument("--log-level", dest="log_level", help="Set log level (DEBUG, INFO, WARNING, ERROR)")
     p.add_argument("--log-format", dest="log_format", choices=["plain", "json"], help="Log output format")
     p.add_argument("--log-file", dest="log_file", help="Write logs to file path")
-    p.add_argument("--config", dest="config", help="Config file path (toml/yaml/json/ini/.env)")
+    p.add_argument("--config", dest="config_path", help="Config file path (toml/yaml/json/ini/.env)")
     p.add_argument("--no-env-override", action="store_true", help="Do not let env vars override file/defaults")
     return p
 
@@ -140,10 +106,10 @@ def build_parser() -> argparse.ArgumentParser:
 def main(argv: Optional[list[str]] = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
-    cfg = _configure_logging_and_load_config(args)
+    cfg = configure_from_args(args)
 
-    host_gis = _gis_from_args_env("host", args, cfg)
-    guest_gis = _gis_from_args_env("guest", args, cfg)
+    host_gis = build_gis("host", args, cfg)
+    guest_gis = build_gis("guest", args, cfg)
 
     ignore_fields = _split_fields(args.ignore_fields)
     layer_keys = _split_fields(args.layer_keys)
@@ -157,43 +123,48 @@ def main(argv: Optional[list[str]] = None) -> int:
         ignore_fields=ignore_fields or None,
         layer_keys=layer_keys or None,
         chunk_size=args.chunk_size,
+        concurrency=args.concurrency,
+        max_workers=args.max_workers,
+        use_oid_fast_path=args.oid_fast_path,
+        bulk_pagination=args.bulk_pages,
         verbose=not args.quiet,
     )
 
     if args.json:
-        print(json.dumps(res, ensure_ascii=False))
+        dump_json(res)
         return 0
 
     title = res.get("title")
     status = res.get("status")
-    print(f"{title or ''} -> {status}")
+    buf = io.StringIO()
+    buf.write(f"{title or ''} -> {status}\n")
     for section in ("layers", "tables"):
-        group = res.get(section, []) or []
-        for entry in group:
+        for entry in res.get(section) or ():
             entry_status = entry.get("status")
             if entry_status == "ok":
                 continue
             name = entry.get("name")
             host_count = entry.get("host_count")
             guest_count = entry.get("guest_count")
-            print(f" - {section[:-1]} '{name}' -> {entry_status} ({host_count} vs {guest_count})")
+            buf.write(f" - {section[:-1]} '{name}' -> {entry_status} ({host_count} vs {guest_count})\n")
             if entry_status == "mismatch":
                 host_only = entry.get("host_only") or []
                 guest_only = entry.get("guest_only") or []
                 if host_only:
-                    print(f"   host-only: {len(host_only)} unique rows (showing up to 3)")
+                    buf.write(f"   host-only: {len(host_only)} unique rows (showing up to 3)\n")
                     for row in host_only[:3]:
-                        print(f"     count={row.get('count')}, attrs={row.get('attributes')}")
+                        buf.write(_row_line(row))
                 if guest_only:
-                    print(f"   guest-only: {len(guest_only)} unique rows (showing up to 3)")
+                    buf.write(f"   guest-only: {len(guest_only)} unique rows (showing up to 3)\n")
                     for row in guest_only[:3]:
-                        print(f"     count={row.get('count')}, attrs={row.get('attributes')}")
+                        buf.write(_row_line(row))
             elif entry_status in {"missing_on_guest", "missing_on_host"}:
-                print(f"   counts: host={host_count} guest={guest_count}")
+                buf.write(f"   counts: host={host_count} guest={guest_count}\n")
             elif entry_status == "error":
-                print(f"   error: {entry.get('message')}")
+                buf.write(f"   error: {entry.get('message')}\n")
             elif entry_status == "skipped":
-                print(f"   note: {entry.get('message')}")
+                buf.write(f"   note: {entry.get('message')}\n")
+    sys.stdout.write(buf.getvalue())
     return 0
 
 
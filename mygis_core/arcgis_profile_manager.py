@@ -27,6 +27,9 @@ python arcgis_profile_manager.py show --name ente-admin
 # Test a profile by logging in and printing the current user and portal
 python arcgis_profile_manager.py test --name ente-admin
 
+# Test every saved profile in parallel
+python arcgis_profile_manager.py test-all
+
 NOTES
 -----
 • Where profiles live: typically at ~/.arcgis/python_api/profiles/<name>
@@ -40,74 +43,166 @@ from __future__ import annotations
 
 import argparse
 import getpass
+import json
 import os
-import shutil
+import re
+import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-try:
+if TYPE_CHECKING:
     from arcgis.gis import GIS
-except Exception as e:  # pragma: no cover
-    sys.stderr.write(
-        "\n[ERROR] The 'arcgis' package is required. Install with:\n\n"
-        "    pip install arcgis\n\n"
-    )
-    raise
+
+
+def _gis_class():
+    """Import `arcgis.gis.GIS` on first use; `list`/`--help` never need it."""
+    try:
+        from arcgis.gis import GIS
+    except Exception:  # pragma: no cover
+        sys.stderr.write(
+            "\n[ERROR] The 'arcgis' package is required. Install with:\n\n"
+            "    pip install arcgis\n\n"
+        )
+        raise
+    return GIS
+
+# Where the ArcGIS Python API keeps saved profiles
+_PROFILES_ROOT = Path.home() / ".arcgis" / "python_api" / "profiles"
+
+try:  # share mygis_core's pooled adapters and TTL'd sign-in cache when installed
+    from mygis_core import auth as _auth
+except Exception:  # standalone copy of this script
+    _auth = None
+
+# Standalone fallback only: signed-in GIS per profile key and one pooled adapter
+_GIS_BY_PROFILE: dict = {}
+_ADAPTER = None
+
+
+def _profile_key(name: str, verify_cert: bool = True) -> tuple:
+    # Same key auth.get_gis uses for profiles, so both share one sign-in
+    return ("profile", name) if verify_cert else ("profile", name, "no-verify")
+
+
+def _pooled(gis):
+    """Mount a keep-alive/retry adapter on the GIS session (best-effort)."""
+    if _auth is not None:
+        return _auth.tune_session(gis)
+    global _ADAPTER
+    session = getattr(getattr(gis, "_con", None), "_session", None)
+    if session is None or not hasattr(session, "mount"):
+        return gis
+    if _ADAPTER is None:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _ADAPTER = HTTPAdapter(pool_connections=50, pool_maxsize=100, max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount("https://", _ADAPTER)
+    session.mount("http://", _ADAPTER)
+    return gis
+
+
+def _cached(key: tuple, factory) -> "GIS":
+    if _auth is not None:
+        return _auth.cached_gis(key, lambda: _pooled(factory()))
+    gis = _GIS_BY_PROFILE.get(key)
+    if gis is None:
+        gis = _GIS_BY_PROFILE[key] = _pooled(factory())
+    return gis
+
+
+def _get_cached_gis(name: str, verify_cert: bool = True) -> "GIS":
+    return _cached(_profile_key(name, verify_cert), lambda: _gis_class()(profile=name, verify_cert=verify_cert))
+
+
+def clear_gis_cache() -> None:
+    if _auth is not None:
+        _auth.clear_gis_cache()
+    _GIS_BY_PROFILE.clear()
 # -----------------------------
 # Core operations
 # -----------------------------
-def credman_list_arcgis(service: str = "arcgis_python_api_profile_passwords"):
-    """
-    Return a list of ArcGIS credential entries from Windows Credential Manager.
+_CMDKEY_TARGET = re.compile(r"Target:\s*(.+)")
+_CMDKEY_USER = re.compile(r"User\s*:\s*(.+)")
 
-    Each item is a dict: {'name': <profile-or-username>, 'user': <UserName>, 'target': <TargetName>}
-    'name' is derived from the credential target (service:username) or falls back to 'user'.
-    """
-    import os
-    results = []
 
-    # Preferred: use pywin32 if present
+def _credman_entry(target: str, user: str) -> dict:
+    # derive name from suffix after "service:"; fall back to the user name
+    name = target.partition(":")[2].strip() or user or "(unknown)"
+    return {"name": name, "user": user, "target": target}
+
+
+def _iter_credman(service: str):
     try:
         import win32cred  # pip install pywin32
-        creds = win32cred.CredEnumerate(None, 0)  # all creds
-        for c in creds or []:
-            target = c.get("TargetName", "")
-            if not target:
-                continue
-            # keyring's Windows backends typically format target like "service:username"
-            if target == service or target.endswith(service):
-                # derive name from suffix after "service:"
-                key = target.split(":", 1)[1].strip() if ":" in target else ""
-                user = c.get("UserName", "") or ""
-                name = key or user or "(unknown)"
-                results.append({"name": name, "user": user, "target": target})
-        if results:
-            return results
-    except Exception:
-        pass  # fall through to cmdkey fallback
+    except ImportError:
+        win32cred = None
+
+    if win32cred is not None:
+        try:
+            creds = win32cred.CredEnumerate(None, 0) or ()  # all creds
+        except Exception:
+            return
+        # keyring's Windows backends typically format target like "service:username"
+        for c in creds:
+            target = c.get("TargetName", "") or ""
+            if target.endswith(service):
+                yield _credman_entry(target, c.get("UserName", "") or "")
+        return
 
     # Fallback: parse `cmdkey /list`
     try:
-        import subprocess, re
         out = subprocess.run(["cmdkey", "/list"], capture_output=True, text=True, check=True).stdout
-        blocks = out.split("\n\n")
-        for b in blocks:
-            if service in b:
-                # Target: <value>
-                m_t = re.search(r"Target:\s*(.+)", b)
-                target = (m_t.group(1).strip() if m_t else service)
-                # User: <value>
-                m_u = re.search(r"User\s*:\s*(.+)", b)
-                user = (m_u.group(1).strip() if m_u else "")
-                # derive name from target suffix after "service:"
-                suffix = target.split(":", 1)[1].strip() if ":" in target else ""
-                name = suffix or user or "(unknown)"
-                results.append({"name": name, "user": user, "target": target})
     except Exception:
-        pass
+        return
+    for b in out.split("\n\n"):
+        if service not in b:
+            continue
+        m_t = _CMDKEY_TARGET.search(b)
+        m_u = _CMDKEY_USER.search(b)
+        target = m_t.group(1).strip() if m_t else service
+        yield _credman_entry(target, m_u.group(1).strip() if m_u else "")
 
-    return results
+
+def credman_list_arcgis(service: str = "arcgis_python_api_profile_passwords", sink=None):
+    """
+    Return a list of ArcGIS credential entries from Windows Credential Manager.
+
+    Each item is a dict: {'name': <profile-or-username>, 'user': <UserName>, 'target': <TargetName>}
+    'name' is derived from the credential target (service:username) or falls back to 'user'.
+    Uses pywin32 when installed (it ships with ArcGIS Pro); `cmdkey /list` is
+    only parsed when it isn't.
+    With `sink`, each entry is passed to `sink(entry)` as it is found and the
+    number of entries is returned instead of a list.
+    """
+    if sink is None:
+        return list(_iter_credman(service))
+    count = 0
+    for entry in _iter_credman(service):
+        sink(entry)
+        count += 1
+    return count
+
+
+def _json_array_sink(out=None):
+    """Sink writing entries as the same indented JSON array `json.dumps(rows, indent=2)` gives."""
+    out = out or sys.stdout
+    state = {"first": True}
+
+    def write(entry: dict) -> None:
+        body = json.dumps(entry, indent=2).replace("\n", "\n  ")
+        out.write(("[\n  " if state["first"] else ",\n  ") + body)
+        state["first"] = False
+
+    def close() -> None:
+        if not state["first"]:
+            out.write("\n]\n")
+
+    return write, close
 
 def create_profile(
     name: str,
@@ -123,8 +218,10 @@ def create_profile(
     if name in existingNames:
         print(f'{name} alredy exists!')
     else:
+        GIS = _gis_class()
         if api_key:
             gis = GIS(url=url or None, api_key=api_key, profile=name, verify_cert=verify_cert)
+            _cached(_profile_key(name, verify_cert), lambda: gis)
         else:
             if not url:
                 raise SystemExit("--url is required for username/password profiles.")
@@ -133,26 +230,91 @@ def create_profile(
             if not password:
                 password = getpass.getpass("Password: ")
             gis = GIS(url=url, username=username, password=password, profile=name, verify_cert=verify_cert)
+            _cached(_profile_key(name, verify_cert), lambda: gis)
 
-def show_profile(name: str) -> None:
-    p = Path.home() / ".arcgis" / "python_api" / "profiles" / name
+def _token_valid(gis) -> bool:
+    """True if the connection already holds an unexpired token (no REST call)."""
+    con = getattr(gis, "_con", None)
+    if not getattr(con, "_token", None):
+        return False
+    exp = getattr(con, "_expiration", None)
     try:
-        gis = GIS(profile=name)
-        who = getattr(getattr(gis, "users", None), "me", None)
+        if isinstance(exp, datetime):
+            return exp > datetime.now(exp.tzinfo)
+        if isinstance(exp, (int, float)) and exp > 1e9:  # epoch s/ms; small values are a lifetime in minutes
+            return (exp / 1000 if exp > 1e11 else exp) > time.time()
+    except Exception:
+        return False
+    # Missing or unrecognized expiration (e.g. a lifetime in minutes): let users.me decide
+    return False
+
+
+def _signed_in_user(gis) -> Optional[str]:
+    """Username from the portal self-description loaded at sign-in."""
+    try:
+        user = (getattr(gis, "properties", None) or {}).get("user") or {}
+        return user.get("username")
+    except Exception:
+        return None
+
+
+def _whoami(gis, deep: bool = True) -> tuple[str, str]:
+    """(username, portal base URL); without `deep`, a valid cached token skips users.me."""
+    baseurl = getattr(getattr(gis, "_con", None), "baseurl", "<unknown>")
+    me = _signed_in_user(gis) if not deep and _token_valid(gis) else None
+    if me is None:
+        users = getattr(gis, "users", None)
+        who = getattr(users, "me", None) if users is not None else None
         me = who.username if who else "<anonymous>"
-        baseurl = getattr(getattr(gis, "_con", None), "baseurl", "<unknown>")
+    return me, baseurl
+
+
+def show_profile(name: str, deep: bool = False) -> None:
+    p = _PROFILES_ROOT / name
+    try:
+        me, baseurl = _whoami(_get_cached_gis(name), deep)
         print(f"Profile: {name}\n  Portal: {baseurl}\n  User:   {me}")
     except Exception:
         print(f"Profile: {name}\n  Location: {p}")
 
 
-def test_profile(name: str, no_verify: bool = False) -> None:
-    gis = GIS(profile=name, verify_cert=not no_verify)
-    who = getattr(getattr(gis, "users", None), "me", None)
-    me = who.username if who else "<anonymous>"
-    baseurl = getattr(getattr(gis, "_con", None), "baseurl", "<unknown>")
+def _test_line(name: str, no_verify: bool = False, deep: bool = False) -> str:
+    gis = _get_cached_gis(name, verify_cert=not no_verify)
+    if not deep and _token_valid(gis):
+        me, baseurl = _whoami(gis, deep=False)
+        return f"OK: profile '{name}' has a valid token → user: {me} | portal: {baseurl}"
+    me, baseurl = _whoami(gis)
     _ = getattr(gis, "properties", {})
-    print(f"OK: profile '{name}' works → user: {me} | portal: {baseurl}")
+    return f"OK: profile '{name}' works → user: {me} | portal: {baseurl}"
+
+
+def test_profile(name: str, no_verify: bool = False, deep: bool = False) -> None:
+    print(_test_line(name, no_verify, deep))
+
+
+def test_all_profiles(
+    service: str = "arcgis_python_api_profile_passwords",
+    no_verify: bool = False,
+    max_workers: int = 16,
+    deep: bool = False,
+) -> int:
+    """Test every profile found in Credential Manager concurrently; returns the failure count."""
+    names = list(dict.fromkeys(r["name"] for r in credman_list_arcgis(service)))
+    if not names:
+        print("(none found)")
+        return 0
+
+    def run(name: str):
+        try:
+            return True, _test_line(name, no_verify, deep)
+        except Exception as exc:
+            return False, f"FAIL: profile '{name}' → {exc}"
+
+    workers = max(1, min(int(max_workers or 1), len(names)))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = list(ex.map(run, names))
+    print("\n".join(line for _, line in results))
+    return sum(1 for ok, _ in results if not ok)
 # -----------------------------
 # CLI
 # -----------------------------
@@ -171,11 +333,21 @@ def build_parser() -> argparse.ArgumentParser:
     # show
     p_show = sub.add_parser("show", help="Show info about a profile")
     p_show.add_argument("--name", required=True, help="Profile name")
+    p_show.add_argument("--deep", action="store_true", help="Always call users.me, even when a valid token is cached")
 
     # test
     p_test = sub.add_parser("test", help="Test a profile by logging in")
     p_test.add_argument("--name", required=True, help="Profile name")
     p_test.add_argument("--no-verify", action="store_true", help="Disable TLS certificate verification during test")
+    p_test.add_argument("--deep", action="store_true", help="Always call users.me, even when a valid token is cached")
+
+    # test-all
+    p_test_all = sub.add_parser("test-all", help="Test every profile in Credential Manager concurrently")
+    p_test_all.add_argument("--service", default="arcgis_python_api_profile_passwords",
+                            help="Service name to filter (default: arcgis_python_api_profile_passwords)")
+    p_test_all.add_argument("--max-workers", type=int, default=16, help="Profiles tested in parallel")
+    p_test_all.add_argument("--no-verify", action="store_true", help="Disable TLS certificate verification during test")
+    p_test_all.add_argument("--deep", action="store_true", help="Always call users.me, even when a valid token is cached")
 
     # create
     p_create = sub.add_parser("create", help="Create a new profile")
@@ -200,22 +372,20 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
     if args.cmd == "list":
-        rows = credman_list_arcgis(args.service)
-        if not rows:
-            print("(none found)")
-            return 0
+        close = None
         if args.show == "target":
-            import json as _json
-            print(_json.dumps(rows, indent=2))
+            sink, close = _json_array_sink()
         elif args.show == "name+user":
-            for r in rows:
-                print(f"{r['name']}\t{r['user']}")
+            sink = lambda r: print(f"{r['name']}\t{r['user']}")
         else:
-            for r in rows:
-                print(r['name'])
+            sink = lambda r: print(r['name'])
+        if not credman_list_arcgis(args.service, sink=sink):
+            print("(none found)")
+        elif close is not None:
+            close()
         return 0
     if args.cmd == "show":
-        show_profile(args.name)
+        show_profile(args.name, deep=args.deep)
         return 0
 
     if args.cmd == "create":
@@ -230,14 +400,19 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 0
 
     if args.cmd == "test":
-        test_profile(args.name, no_verify=args.no_verify)
+        test_profile(args.name, no_verify=args.no_verify, deep=args.deep)
         return 0
 
+    if args.cmd == "test-all":
+        failures = test_all_profiles(
+            args.service, no_verify=args.no_verify, max_workers=args.max_workers, deep=args.deep
+        )
+        return 1 if failures else 0
+
     return 1
 
 
 if __name__ == "__main__":
-    import sys
     # Use sys.exit for a clean exit code without a traceback in normal CLI use.
     # In notebooks/IDEs that treat SystemExit as an error, avoid exiting.
     in_ipynb = "ipykernel" in sys.modules or "PYCHARM_HOSTED" in os.environ
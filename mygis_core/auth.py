@@ -1,8 +1,124 @@
-from typing import Optional
-from arcgis.gis import GIS
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlparse
+
 from . import config as myconfig
 
-def get_gis(cfg: Optional[myconfig.Config] = None) -> GIS:
+if TYPE_CHECKING:  # arcgis is heavy to import; load it only when connecting
+    from arcgis.gis import GIS
+
+# One pooled adapter per portal host, shared by every GIS built for it
+_ADAPTERS: dict[tuple[str, int], object] = {}
+_adapters_lock = threading.Lock()
+_tuned_sessions: weakref.WeakSet = weakref.WeakSet()
+
+
+def _portal_netloc(gis) -> str:
+    url = getattr(gis, "url", None) or getattr(getattr(gis, "_con", None), "baseurl", None)
+    return urlparse(str(url)).netloc.lower() if url else ""
+
+
+def _shared_adapter(netloc: str, pool_size: int):
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    key = (netloc, pool_size)
+    with _adapters_lock:
+        adapter = _ADAPTERS.get(key) if netloc else None
+        if adapter is None:
+            adapter = HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size * 2,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(500, 502, 503, 504),
+                    allowed_methods=frozenset(["GET", "POST"]),
+                ),
+            )
+            if netloc:
+                _ADAPTERS[key] = adapter
+    return adapter
+
+
+def tune_session(gis: GIS, pool_size: int = 50) -> GIS:
+    """Mount a larger, retrying HTTPAdapter on the GIS's underlying `requests.Session`.
+
+    urllib3's default pool keeps only 10 connections per host, so concurrent
+    layer/replica probes end up discarding and re-opening TLS connections.
+    GIS objects for the same portal host share one adapter (and so one
+    connection pool); sessions stay separate so each keeps its own auth.
+    Only plain `HTTPAdapter`s are replaced: custom adapters arcgis mounts
+    (PKI/client-certificate auth and the like) are left in place.
+    Best-effort: GIS builds without a reachable session are returned unchanged.
+    """
+    from requests.adapters import HTTPAdapter
+
+    session = getattr(getattr(gis, "_con", None), "_session", None)
+    if session is None or not hasattr(session, "mount"):
+        return gis
+
+    adapter = _shared_adapter(_portal_netloc(gis), max(1, int(pool_size)))
+    for prefix in ("https://", "http://"):
+        try:
+            current = session.get_adapter(prefix)
+        except Exception:  # nothing mounted for this scheme
+            current = None
+        if current is None or type(current) is HTTPAdapter:
+            session.mount(prefix, adapter)
+    try:
+        _tuned_sessions.add(session)
+    except TypeError:  # not weak-referenceable; ensure_pooled will just re-mount
+        pass
+    return gis
+
+
+def ensure_pooled(gis: GIS, pool_size: int = 32) -> GIS:
+    """`tune_session` unless the GIS session was already tuned (keeps its pool size)."""
+    session = getattr(getattr(gis, "_con", None), "_session", None)
+    try:
+        if session is not None and session in _tuned_sessions:
+            return gis
+    except TypeError:
+        pass
+    return tune_session(gis, pool_size=pool_size)
+
+
+# Signed-in GIS objects per (mode, portal, user, password digest); entries are
+# dropped after _GIS_CACHE_TTL seconds so long-running processes re-authenticate.
+_GIS_CACHE_MAX = 32
+_GIS_CACHE_TTL = 900.0
+_gis_cache: dict[tuple, tuple[float, object]] = {}
+_gis_lock = threading.Lock()
+
+
+def clear_gis_cache() -> None:
+    with _gis_lock:
+        _gis_cache.clear()
+
+
+def cached_gis(key: tuple, factory):
+    """GIS cached under `key` for `_GIS_CACHE_TTL` seconds; `factory()` builds it on a miss."""
+    now = time.monotonic()
+    with _gis_lock:
+        hit = _gis_cache.get(key)
+        if hit is not None and now - hit[0] < _GIS_CACHE_TTL:
+            return hit[1]
+    gis = factory()
+    with _gis_lock:
+        _gis_cache.pop(key, None)
+        if len(_gis_cache) >= _GIS_CACHE_MAX:
+            _gis_cache.pop(next(iter(_gis_cache)))
+        _gis_cache[key] = (now, gis)
+    return gis
+
+
+def get_gis(cfg: Optional[myconfig.Config] = None, *, cached: bool = True, pool_size: int = 50) -> GIS:
     """Create and return an ArcGIS `GIS` connection based on configuration/env.
     Resolution order (first match wins):
     1) profile: use a saved ArcGIS profile (e.g., `MYGIS_PROFILE=work`)
@@ -12,7 +128,12 @@ def get_gis(cfg: Optional[myconfig.Config] = None) -> GIS:
     - profile (or `arcgis_profile`, `agol_profile`)
     - auth: "pro" (default) | "home"
     - portal_url (or "portal"), username, password
+    Connections are reused per process (see `clear_gis_cache`) unless
+    `cached=False`, and their session gets the shared pooled adapter from
+    `tune_session`.
     """
+    from arcgis.gis import GIS
+
     cfg = cfg or myconfig.load_config()
 
     # 1) Saved profile
@@ -22,20 +143,28 @@ def get_gis(cfg: Optional[myconfig.Config] = None) -> GIS:
         or cfg.get("agol_profile")
     )
     if profile:
-        return GIS(profile=str(profile))
-
-    # 2) Pro/Home
-    auth = str(cfg.get("auth", "pro")).lower()
-    if auth in ("pro", "home"):
-        return GIS(auth)
-
-    # 3) Explicit portal credentials
-    portal_url = cfg.get("portal_url") or cfg.get("portal")
-    username = cfg.get("username")
-    password = cfg.get("password")
+        key = ("profile", str(profile))
+        factory = lambda: GIS(profile=str(profile))
+    else:
+        # 2) Pro/Home
+        auth = str(cfg.get("auth", "pro")).lower()
+        portal_url = cfg.get("portal_url") or cfg.get("portal")
+        username = cfg.get("username")
+        password = cfg.get("password")
+        if auth in ("pro", "home"):
+            key = ("auth", auth)
+            factory = lambda: GIS(auth)
+        # 3) Explicit portal credentials
+        elif portal_url and username and password:
+            digest = hashlib.sha256(str(password).encode("utf-8")).hexdigest()
+            key = ("login", str(portal_url), str(username), digest)
+            factory = lambda: GIS(str(portal_url), str(username), str(password))
+        # Fallback to Pro sign-in if nothing else configured
+        else:
+            key = ("auth", "pro")
+            factory = lambda: GIS("pro")
 
-    if portal_url and username and password:
-        return GIS(str(portal_url), str(username), str(password))
+    def build():
+        return tune_session(factory(), pool_size=pool_size)
 
-    # Fallback to Pro sign-in if nothing else configured
-    return GIS("pro")
+    return cached_gis(key, build) if cached else build()
@@ -1,11 +1,22 @@
+from __future__ import annotations
+
 import argparse
 import json
+import os
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional, TextIO
 
+from . import auth as auth_mod
 from . import config as config_mod
 from . import log as log_mod
-from . import replicas as replicas_mod
+
+if TYPE_CHECKING:  # arcgis is imported lazily so `--help`/`config show` stay fast
+    from arcgis.gis import GIS
+
+try:  # optional: faster JSON encoding for large outputs
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
 
 
 def _add_common_args(p: argparse.ArgumentParser):
@@ -24,8 +35,48 @@ def _add_common_args(p: argparse.ArgumentParser):
     )
 
 
-def _configure_from_args(args) -> config_mod.Config:
-    paths = [args.config_path] if args.config_path else None
+def add_perf_args(p: argparse.ArgumentParser, *, max_workers: bool = True, batch_size: bool = False):
+    """Register throughput knobs shared by the example scripts.
+
+    `--pool-size` is always added; `--max-workers` and `--batch-size` only
+    where the script has something to parallelize or page.
+    """
+    if max_workers:
+        p.add_argument("--max-workers", dest="max_workers", type=int, default=16, help="Worker threads for concurrent REST calls (default 16)")
+    p.add_argument("--pool-size", dest="pool_size", type=int, default=50, help="HTTP connection pool size per portal (default 50)")
+    if batch_size:
+        p.add_argument(
+            "--batch-size",
+            "--chunk-size",
+            dest="chunk_size",
+            metavar="BATCH_SIZE",
+            type=int,
+            default=2000,
+            help="Records per query page (0 to fetch all in one request)",
+        )
+
+
+_PERF_ARGS = ("max_workers", "pool_size", "chunk_size", "concurrency")
+
+# (level, json_format, file, stream) logging was last configured with from CLI args
+_LOG_CONFIGURED: Optional[tuple] = None
+
+
+def configure_from_args(
+    args,
+    *,
+    search_paths: Optional[Iterable[str]] = None,
+    log_stream: Optional[TextIO] = None,
+) -> config_mod.Config:
+    """Load config and configure logging from parsed common args.
+
+    `search_paths` replaces the default config file search order; an explicit
+    `--config` path is always tried first. `log_stream` redirects console
+    logging (e.g. to stderr while JSON is streamed to stdout).
+    """
+    paths = list(search_paths) if search_paths else None
+    if args.config_path:
+        paths = [args.config_path] + (paths or [])
     cfg = config_mod.load_config(paths=paths, env_override=not args.no_env_override)
 
     level = args.log_level or cfg.get("log_level")
@@ -33,35 +84,175 @@ def _configure_from_args(args) -> config_mod.Config:
     file = args.log_file or cfg.get("log_file")
     json_format: Optional[bool] = None if fmt is None else (str(fmt).lower() == "json")
 
-    log_mod.configure_logging(level=level, json_format=json_format, file=file)
+    # Repeat main(argv) calls in one process only touch handlers when settings change
+    global _LOG_CONFIGURED
+    key = (level, json_format, file, log_stream)
+    if _LOG_CONFIGURED != key:
+        log_mod.configure_logging(
+            level=level,
+            json_format=json_format,
+            file=file,
+            reset=_LOG_CONFIGURED is not None,
+            stream=log_stream,
+        )
+        _LOG_CONFIGURED = key
+
+    perf = {name: getattr(args, name) for name in _PERF_ARGS if getattr(args, name, None) is not None}
+    if perf and not (getattr(args, "quiet", False) or getattr(args, "json", False)):
+        log_mod.get_logger(__name__).info(
+            "Performance settings: %s",
+            ", ".join(f"{k}={v}" for k, v in perf.items()),
+            extra=perf,
+        )
     return cfg
 
 
-def _cmd_config_show(args) -> int:
-    cfg = _configure_from_args(args)
-    data = cfg.data
-    if args.pretty:
-        print(json.dumps(data, indent=2, ensure_ascii=False))
+# Per-prefix GIS settings: (args attr suffix, env var suffixes, config key suffixes).
+# Each value resolves args -> env -> config.
+_GIS_KEYS = (
+    ("profile", ("PROFILE",), ("profile",)),
+    ("portal", ("PORTAL_URL", "PORTAL"), ("portal_url", "portal")),
+    ("username", ("USERNAME",), ("username",)),
+    ("password", ("PASSWORD",), ("password",)),
+    ("auth", (), ("auth",)),
+)
+
+
+def _gis_key_table(pfx: str) -> tuple:
+    """Expand `_GIS_KEYS` into (name, arg attr, env names, cfg keys) for one prefix."""
+    return tuple(
+        (
+            name,
+            f"{pfx}_{name}",
+            tuple(f"MYGIS_{pfx.upper()}_{suffix}" for suffix in env_suffixes),
+            tuple(f"{pfx}_{suffix}" for suffix in cfg_suffixes),
+        )
+        for name, env_suffixes, cfg_suffixes in _GIS_KEYS
+    )
+
+
+# Precomputed lookup names per prefix; other prefixes are expanded on first use
+_ENV_KEYS = {pfx: _gis_key_table(pfx) for pfx in ("host", "guest")}
+
+
+def build_gis(prefix: str, args, cfg: config_mod.Config) -> GIS:
+    """Build a GIS connection using args/env/config with a given prefix.
+
+    Prefix examples: 'host', 'guest'.
+    Resolution order (first match wins):
+    1) profile
+    2) portal_url (or portal) + username + password
+    3) auth: "pro" | "home"
+    4) ArcGIS Pro sign-in
+    Env vars: MYGIS_{PREFIX}_PROFILE, MYGIS_{PREFIX}_PORTAL_URL, etc.
+    The connection pool is tuned via `auth.tune_session` (`args.pool_size`).
+    """
+    from arcgis.gis import GIS
+
+    pfx = prefix.lower()
+    table = _ENV_KEYS.get(pfx)
+    if table is None:
+        table = _ENV_KEYS[pfx] = _gis_key_table(pfx)
+    environ = os.environ
+    values = {}
+    for name, attr, env_names, cfg_keys in table:
+        value = getattr(args, attr, None)
+        for env_name in env_names:
+            value = value or environ.get(env_name)
+        for cfg_key in cfg_keys:
+            value = value or cfg.get(cfg_key)
+        values[name] = value
+
+    if values["profile"]:
+        gis = GIS(profile=str(values["profile"]))
+    elif values["portal"] and values["username"] and values["password"]:
+        gis = GIS(str(values["portal"]), str(values["username"]), str(values["password"]))
+    elif values["auth"]:
+        gis = GIS(str(values["auth"]))
+    else:
+        gis = GIS("pro")
+    return auth_mod.tune_session(gis, pool_size=getattr(args, "pool_size", None) or 50)
+
+
+def _json_bytes(obj, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:  # e.g. >64-bit ints; let stdlib json decide
+            pass
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dump_json(obj, *, out=None, pretty: bool = False) -> None:
+    """Write `obj` to stdout as UTF-8 JSON (orjson when available).
+
+    Compact single-line output unless `pretty` (2-space indent).
+    """
+    out = out or sys.stdout
+    data = _json_bytes(obj, pretty)
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:  # text-only streams (e.g. captured output)
+        out.write(data.decode("utf-8") + "\n")
+        return
+    out.flush()  # keep ordering with earlier print() output
+    buffer.write(data)
+    buffer.write(b"\n")
+    buffer.flush()
+
+
+def stream_json_array(items: Iterable, *, out=None) -> int:
+    """Write `items` to stdout as one JSON array, serializing item by item.
+
+    Nothing is accumulated, so output starts as soon as the first item is
+    produced and memory stays flat for large result sets. Returns the count.
+    """
+    out = out or sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:  # text-only streams (e.g. captured output)
+        write = lambda data: out.write(data.decode("utf-8"))
     else:
-        print(json.dumps(data, ensure_ascii=False))
+        out.flush()  # keep ordering with earlier print() output
+        write = buffer.write
+    count = 0
+    write(b"[")
+    for item in items:
+        if count:
+            write(b",")
+        write(_json_bytes(item))
+        count += 1
+    write(b"]\n")
+    (buffer or out).flush()
+    return count
+
+
+def _cmd_config_show(args) -> int:
+    cfg = configure_from_args(args)
+    dump_json(cfg.data, pretty=args.pretty)
     return 0
 
 
 def _cmd_replicas_list(args) -> int:
     # Configure logging and load config; auth is resolved inside list_replicas
-    _configure_from_args(args)
+    from . import replicas as replicas_mod
+
+    configure_from_args(args)
     replicas = replicas_mod.list_replicas(
         args.service,
         verbose=not args.quiet,
         gis=None,
     )
     if args.json:
-        print(json.dumps(replicas, ensure_ascii=False))
+        dump_json(replicas)
     return 0
 
 
 def _cmd_log_test(args) -> int:
-    _configure_from_args(args)
+    configure_from_args(args)
     logger = log_mod.get_logger("mygis")
     logger.debug("debug message", extra={"example": True})
     logger.info("info message", extra={"example": True})
@@ -71,33 +262,30 @@ def _cmd_log_test(args) -> int:
 
 
 def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(prog="mygis", description="MyGIS utilities CLI")
-    _add_common_args(parser)
+    # Common flags are declared once and inherited by every (sub)parser level
+    common = argparse.ArgumentParser(add_help=False)
+    _add_common_args(common)
+
+    parser = argparse.ArgumentParser(prog="mygis", description="MyGIS utilities CLI", parents=[common])
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    p_cfg = subparsers.add_parser("config", help="Configuration helpers")
-    _add_common_args(p_cfg)
+    p_cfg = subparsers.add_parser("config", parents=[common], help="Configuration helpers")
     sp_cfg = p_cfg.add_subparsers(dest="subcommand", required=True)
-    p_cfg_show = sp_cfg.add_parser("show", help="Show effective configuration as JSON")
-    _add_common_args(p_cfg_show)
+    p_cfg_show = sp_cfg.add_parser("show", parents=[common], help="Show effective configuration as JSON")
     p_cfg_show.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
     p_cfg_show.set_defaults(func=_cmd_config_show)
 
-    p_log = subparsers.add_parser("log", help="Logging helpers")
-    _add_common_args(p_log)
+    p_log = subparsers.add_parser("log", parents=[common], help="Logging helpers")
     sp_log = p_log.add_subparsers(dest="subcommand", required=True)
-    p_log_test = sp_log.add_parser("test", help="Emit test log messages at all levels")
-    _add_common_args(p_log_test)
+    p_log_test = sp_log.add_parser("test", parents=[common], help="Emit test log messages at all levels")
     p_log_test.set_defaults(func=_cmd_log_test)
 
     # replicas commands
-    p_repl = subparsers.add_parser("replicas", help="Replica operations")
-    _add_common_args(p_repl)
+    p_repl = subparsers.add_parser("replicas", parents=[common], help="Replica operations")
     sp_repl = p_repl.add_subparsers(dest="subcommand", required=True)
 
-    p_repl_list = sp_repl.add_parser("list", help="List replicas for a service URL or item ID")
-    _add_common_args(p_repl_list)
+    p_repl_list = sp_repl.add_parser("list", parents=[common], help="List replicas for a service URL or item ID")
     p_repl_list.add_argument("service", help="FeatureService root URL, layer URL, or Item ID")
     p_repl_list.add_argument("--json", action="store_true", help="Print replicas as JSON to stdout")
     p_repl_list.add_argument("--quiet", action="store_true", help="Suppress summary table logging")
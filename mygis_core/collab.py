@@ -1,29 +1,61 @@
 from __future__ import annotations
 
+import json
+import logging
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from operator import itemgetter
 from typing import Optional
 
-from collections import Counter
 from arcgis.features import FeatureLayerCollection
 from arcgis.gis import GIS
 
+from . import auth as myauth
 from . import log as mylog
 
 
-def _safe_get_last_edit_ms(layer) -> Optional[int]:
+def _layer_props(layer):
+    """`layer.properties` (hydrated once per layer object, i.e. once per comparison)."""
+    return getattr(layer, "properties", None)
+
+
+def _layer_display_name(layer, fallback: str) -> str:
+    """Service-defined layer name (from the layer's properties), else `layer.name`, else `fallback`."""
+    props = _layer_props(layer)
+    get = getattr(props, "get", None)
+    return (get("name") if get else None) or getattr(layer, "name", fallback)
+
+
+def _safe_get_last_edit_ms(layer, props=None) -> Optional[int]:
     try:
-        props = getattr(layer, "properties", {}) or {}
-        ei = getattr(props, "editingInfo", None) or getattr(props, "editinginfo", None)
+        props = props if props is not None else (_layer_props(layer) or {})
+        # PropertyMap is a dict: plain lookups skip its __getattr__ dispatch
+        ei = props.get("editingInfo") or props.get("editinginfo")
         if isinstance(ei, dict):
             return ei.get("lastEditDate") or ei.get("last_edit_date")
         # Some services expose update dates directly
-        return getattr(props, "lastEditDate", None) or getattr(props, "updateDate", None)
+        return props.get("lastEditDate") or props.get("updateDate")
     except Exception:
         return None
 
 
-def _safe_count(layer) -> Optional[int]:
+def _edit_fingerprint(layer, props=None) -> Optional[tuple]:
+    """(lastEditDate, schemaLastEditDate, dataLastEditDate) from editingInfo, or None."""
     try:
-        q = layer.query(where="1=1", returnCountOnly=True)
+        props = props if props is not None else (_layer_props(layer) or {})
+        ei = props.get("editingInfo") or props.get("editinginfo")
+        if not isinstance(ei, dict):
+            return None
+        fp = (ei.get("lastEditDate"), ei.get("schemaLastEditDate"), ei.get("dataLastEditDate"))
+        return fp if any(v is not None for v in fp) else None
+    except Exception:
+        return None
+
+
+def _safe_count(layer, where: str = "1=1") -> Optional[int]:
+    try:
+        q = layer.query(where=where or "1=1", returnCountOnly=True)
         if isinstance(q, dict):
             return int(q.get("count", 0))
         return int(getattr(q, "count", 0))
@@ -31,20 +63,70 @@ def _safe_count(layer) -> Optional[int]:
         return None
 
 
-def _layer_key(layer) -> str:
+def _layer_id(layer, props=None) -> Optional[int]:
+    try:
+        props = props if props is not None else (_layer_props(layer) or {})
+        lid = props.get("id")
+        if lid is None:
+            lid = props.get("layerId")
+        if lid is None:
+            lid = getattr(layer, "_layer_id", None)
+        return int(lid) if lid is not None else None
+    except Exception:
+        return None
+
+
+def _batched_counts(flc, layers: list, props_of: Optional[dict] = None) -> dict[int, int]:
+    """Row counts for several sublayers in one service-level query.
+
+    Uses `{FeatureServer}/query?layerDefs=...&returnCountOnly=true`; returns a
+    map of id(layer) -> count for the layers the service answered for, or an
+    empty map if the service can't do cross-layer queries.
+    """
+    by_id = {}
+    for layer in layers:
+        lid = _layer_id(layer, (props_of or {}).get(id(layer)))
+        if lid is not None:
+            by_id[lid] = layer
+    url = getattr(flc, "url", None)
+    con = getattr(flc, "_con", None)
+    if len(by_id) < 2 or not url or con is None:
+        return {}
+    try:
+        res = con.get(
+            f"{url}/query",
+            params={
+                "f": "json",
+                "layerDefs": json.dumps({str(lid): "1=1" for lid in by_id}),
+                "returnCountOnly": "true",
+            },
+        )
+        counts = {}
+        for entry in (res or {}).get("layers") or ():
+            layer = by_id.get(entry.get("id"))
+            if layer is not None and entry.get("count") is not None:
+                counts[id(layer)] = int(entry["count"])
+        return counts
+    except Exception:
+        return {}
+
+
+def _layer_key(layer, props=None) -> str:
     """Stable key to align layers/tables across portals.
     Prefer layer.name; fall back to layerId/index.
     """
+    if props is None:
+        props = _layer_props(layer) or {}
     try:
-        name = getattr(layer, "properties", {}).get("name") or getattr(layer, "name", None)
+        name = props.get("name") or getattr(layer, "name", None)
         if name:
             return str(name)
     except Exception:
         pass
     try:
-        lid = getattr(layer, "properties", {}).get("id")
+        lid = props.get("id")
         if lid is None:
-            lid = getattr(layer, "properties", {}).get("layerId")
+            lid = props.get("layerId")
         if lid is None:
             lid = getattr(layer, "_layer_id", None)
         if lid is not None:
@@ -54,6 +136,132 @@ def _layer_key(layer) -> str:
     return str(id(layer))
 
 
+def _needs_counts(
+    h, g, deep: bool = True, props_of: Optional[dict] = None, unchanged: bool = False
+) -> bool:
+    """False when matching edit timestamps make count queries unnecessary.
+
+    Prefers the full editingInfo fingerprint; services without one fall back
+    to the plain last-edit/update date, which must be present on both sides.
+    With `unchanged` (service-level edit dates match) the fingerprint is not
+    consulted, but the layer dates must still be present and equal to skip.
+    Only sound on properties read during the current comparison (`props_of`
+    snapshots or the freshly opened layer objects), never on cached metadata.
+    """
+    if deep or h is None or g is None:
+        return True
+    props_of = props_of or {}
+    hp, gp = props_of.get(id(h)), props_of.get(id(g))
+    hfp = _edit_fingerprint(h, hp)
+    if hfp is not None and not unchanged:
+        return hfp != _edit_fingerprint(g, gp)
+    ht = _safe_get_last_edit_ms(h, hp)
+    gt = _safe_get_last_edit_ms(g, gp)
+    return ht is None or gt is None or ht != gt
+
+
+def _service_last_edit(flc) -> Optional[int]:
+    """Service-level editingInfo.lastEditDate of a FeatureLayerCollection, or None."""
+    try:
+        props = getattr(flc, "properties", None) or {}
+        ei = props.get("editingInfo") or props.get("editinginfo")
+        return ei.get("lastEditDate") if isinstance(ei, dict) else None
+    except Exception:
+        return None
+
+
+def _probe_layer(
+    kind: str,
+    key: str,
+    h,
+    g,
+    deep: bool = True,
+    counts: Optional[dict] = None,
+    props_of: Optional[dict] = None,
+    name_of: Optional[dict] = None,
+    unchanged: bool = False,
+) -> dict:
+    """Fetch counts/timestamps for one aligned host/guest layer pair.
+    Either side may be None (missing on guest / extra on guest).
+    Unless `deep`, identical edit timestamps count as "ok" without issuing
+    the two count queries; with `unchanged` (matching service edit dates) the
+    layers' own dates alone decide. `counts`, `props_of` and `name_of` map
+    id(layer) to a prefetched count, properties snapshot and display name.
+    """
+    props_of = props_of if props_of is not None else {}
+
+    def props(layer):
+        p = props_of.get(id(layer))
+        return p if p is not None else (_layer_props(layer) or {})
+
+    def name(layer):
+        if name_of is not None and id(layer) in name_of:
+            return name_of[id(layer)] or key
+        return props(layer).get("name") or getattr(layer, "name", key)
+
+    def count(layer):
+        if counts is not None and id(layer) in counts:
+            return counts[id(layer)]
+        return _safe_count(layer)
+
+    if h is None:
+        return {
+            "kind": kind,
+            "key": key,
+            "name": name(g),
+            "status": "extra_on_guest",
+            "host_count": None,
+            "guest_count": count(g),
+            "host_last_edit": None,
+            "guest_last_edit": _safe_get_last_edit_ms(g, props(g)),
+        }
+
+    entry = {
+        "kind": kind,
+        "key": key,
+        "name": name(h),
+    }
+    if g is None:
+        entry.update({
+            "status": "missing_on_guest",
+            "host_count": count(h),
+            "host_last_edit": _safe_get_last_edit_ms(h, props(h)),
+            "guest_count": None,
+            "guest_last_edit": None,
+        })
+        return entry
+
+    if not _needs_counts(h, g, deep, props_of, unchanged):
+        ht = _safe_get_last_edit_ms(h, props(h))
+        gt = _safe_get_last_edit_ms(g, props(g))
+        entry.update({
+            "status": "ok",
+            "host_count": None,
+            "guest_count": None,
+            "count_match": None,
+            "counts_skipped": True,
+            "host_last_edit": ht,
+            "guest_last_edit": gt,
+            "timestamp_match": (ht == gt) if (ht is not None and gt is not None) else None,
+        })
+        return entry
+
+    hc = count(h)
+    gc = count(g)
+    ht = _safe_get_last_edit_ms(h, props(h))
+    gt = _safe_get_last_edit_ms(g, props(g))
+    entry.update({
+        "status": "ok" if (hc == gc and (ht is None or gt is None or ht == gt)) else "mismatch",
+        "host_count": hc,
+        "guest_count": gc,
+        "count_match": (hc == gc) if (hc is not None and gc is not None) else None,
+        "host_last_edit": ht,
+        "guest_last_edit": gt,
+        "timestamp_match": (ht == gt) if (ht is not None and gt is not None) else None,
+    })
+    return entry
+
+
 def compare_feature_service_items(
     host_gis: GIS,
     guest_gis: GIS,
@@ -61,16 +269,33 @@ def compare_feature_service_items(
     guest_item_id: str,
     *,
     verbose: bool = True,
+    max_workers: Optional[int] = None,
+    deep: bool = True,
+    host_item=None,
+    guest_item=None,
 ) -> dict:
     """Compare a pair of hosted feature service items across two portals.
 
     Compares per-layer record counts and last edit timestamps.
+    By default every layer is counted. With `deep=False`, layers whose
+    editingInfo (last/schema/data edit dates) matches on both sides are
+    reported "ok" without count queries, as are shared layers with equal
+    last-edit dates when the services' own lastEditDate matches.
+    Count queries for all layers/tables run concurrently (`max_workers`
+    threads, default scales with the number of queries).
+    `host_item`/`guest_item` may pass already-fetched `Item` objects to skip
+    the `content.get` lookups.
     Returns a result dict with details and overall status.
     """
     logger = mylog.get_logger(__name__)
-
-    host_item = host_gis.content.get(host_item_id)
-    guest_item = guest_gis.content.get(guest_item_id)
+    # Concurrent count queries need more than urllib3's default 10 connections
+    myauth.ensure_pooled(host_gis)
+    myauth.ensure_pooled(guest_gis)
+
+    if host_item is None:
+        host_item = host_gis.content.get(host_item_id)
+    if guest_item is None:
+        guest_item = guest_gis.content.get(guest_item_id)
     if host_item is None or guest_item is None:
         return {
             "status": "error",
@@ -90,76 +315,72 @@ def compare_feature_service_items(
             "guest_item_id": guest_item_id,
         }
 
+    # Properties snapshot and display name per layer object, read once for this comparison
+    props_of: dict[int, object] = {}
+    name_of: dict[int, Optional[str]] = {}
+
+    def index(lyr) -> str:
+        props = props_of[id(lyr)] = _layer_props(lyr) or {}
+        name_of[id(lyr)] = props.get("name") or getattr(lyr, "name", None)
+        return _layer_key(lyr, props)
+
     # Build maps of layers and tables by name/key
     def map_by_key(flc: FeatureLayerCollection):
-        layers = getattr(flc, "layers", []) or []
-        tables = getattr(flc, "tables", []) or []
-        m: dict[str, dict] = {}
-        for lyr in layers:
-            m.setdefault("layers", {})[_layer_key(lyr)] = lyr
-        for tbl in tables:
-            m.setdefault("tables", {})[_layer_key(tbl)] = tbl
-        return m
+        return {
+            "layers": {index(lyr): lyr for lyr in getattr(flc, "layers", []) or []},
+            "tables": {index(tbl): tbl for tbl in getattr(flc, "tables", []) or []},
+        }
 
     host_map = map_by_key(host_flc)
     guest_map = map_by_key(guest_flc)
 
-    def compare_collection(kind: str) -> list[dict]:
-        results: list[dict] = []
+    def collection_pairs(kind: str) -> list[tuple]:
         host_objs = host_map.get(kind, {})
         guest_objs = guest_map.get(kind, {})
-        for key, h in host_objs.items():
-            g = guest_objs.get(key)
-            entry = {
-                "kind": kind,
-                "key": key,
-                "name": getattr(h, "properties", {}).get("name") or getattr(h, "name", key),
-            }
-            if g is None:
-                entry.update({
-                    "status": "missing_on_guest",
-                    "host_count": _safe_count(h),
-                    "host_last_edit": _safe_get_last_edit_ms(h),
-                    "guest_count": None,
-                    "guest_last_edit": None,
-                })
-                results.append(entry)
-                continue
-
-            hc = _safe_count(h)
-            gc = _safe_count(g)
-            ht = _safe_get_last_edit_ms(h)
-            gt = _safe_get_last_edit_ms(g)
-            entry.update({
-                "status": "ok" if (hc == gc and (ht is None or gt is None or ht == gt)) else "mismatch",
-                "host_count": hc,
-                "guest_count": gc,
-                "count_match": (hc == gc) if (hc is not None and gc is not None) else None,
-                "host_last_edit": ht,
-                "guest_last_edit": gt,
-                "timestamp_match": (ht == gt) if (ht is not None and gt is not None) else None,
-            })
-            results.append(entry)
-        # Detect extras on guest
-        for key in guest_objs.keys():
-            if key not in host_objs:
-                g = guest_objs[key]
-                results.append({
-                    "kind": kind,
-                    "key": key,
-                    "name": getattr(g, "properties", {}).get("name") or getattr(g, "name", key),
-                    "status": "extra_on_guest",
-                    "host_count": None,
-                    "guest_count": _safe_count(g),
-                    "host_last_edit": None,
-                    "guest_last_edit": _safe_get_last_edit_ms(g),
-                })
-        return results
-
-    layer_results = compare_collection("layers")
-    table_results = compare_collection("tables")
-
-    any_mismatch = any(r.get("status") not in {"ok"} for r in layer_results + table_results)
+        pairs = [(kind, key, h, guest_objs.get(key)) for key, h in host_objs.items()]
+        # Extras on guest
+        pairs.extend((kind, key, None, g) for key, g in guest_objs.items() if key not in host_objs)
+        return pairs
+
+    # Equal service-level edit dates: nothing was edited on either side since
+    unchanged = not deep and _service_last_edit(host_flc) is not None and (
+        _service_last_edit(host_flc) == _service_last_edit(guest_flc)
+    )
+
+    layer_pairs = collection_pairs("layers")
+    table_pairs = collection_pairs("tables")
+    all_pairs = layer_pairs + table_pairs
+
+    # Count queries are the blocking REST calls; issue every host and guest
+    # count as its own task so they all overlap, then assemble entries.
+    to_count = [
+        lyr
+        for _, _, h, g in all_pairs
+        if _needs_counts(h, g, deep, props_of, unchanged)
+        for lyr in (h, g)
+        if lyr is not None
+    ]
+    # One service-level layerDefs query per side; per-layer queries only for
+    # whatever the batch didn't answer.
+    counts: dict[int, Optional[int]] = {}
+    for flc, objs in ((host_flc, host_map), (guest_flc, guest_map)):
+        side = {id(o) for kind in objs.values() for o in kind.values()}
+        counts.update(_batched_counts(flc, [lyr for lyr in to_count if id(lyr) in side], props_of))
+    remaining = [lyr for lyr in to_count if id(lyr) not in counts]
+    workers = max_workers or min(32, len(remaining))
+    if len(remaining) > 1 and workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            counts.update(zip(map(id, remaining), executor.map(_safe_count, remaining)))
+    else:
+        counts.update((id(lyr), _safe_count(lyr)) for lyr in remaining)
+    probed = [
+        _probe_layer(*args, deep=deep, counts=counts, props_of=props_of, name_of=name_of, unchanged=unchanged)
+        for args in all_pairs
+    ]
+    layer_results = probed[: len(layer_pairs)]
+    table_results = probed[len(layer_pairs) :]
+
+    any_mismatch = any(r.get("status") != "ok" for r in probed)
     result = {
         "status": "ok" if not any_mismatch else "mismatch",
         "host_item_id": host_item_id,
@@ -171,9 +392,11 @@ def compare_feature_service_items(
         "tables": table_results,
     }
 
-    if verbose:
+    if verbose and logger.isEnabledFor(logging.INFO):
         logger.info(
             "Compared service '%s' -> status: %s",
+            result["title"],
+            result["status"],
             extra={"title": result["title"], "status": result["status"]},
         )
 
@@ -182,18 +405,29 @@ def compare_feature_service_items(
 
 
 def _map_flc_by_key(flc: FeatureLayerCollection) -> dict[str, dict[str, object]]:
-    layers = getattr(flc, "layers", []) or []
-    tables = getattr(flc, "tables", []) or []
-    mapped: dict[str, dict[str, object]] = {}
-    for lyr in layers:
-        mapped.setdefault("layers", {})[_layer_key(lyr)] = lyr
-    for tbl in tables:
-        mapped.setdefault("tables", {})[_layer_key(tbl)] = tbl
-    return mapped
+    return {
+        "layers": {_layer_key(lyr): lyr for lyr in getattr(flc, "layers", []) or []},
+        "tables": {_layer_key(tbl): tbl for tbl in getattr(flc, "tables", []) or []},
+    }
+
+
+_ALWAYS_IGNORED_FIELDS = frozenset({"shape", "shape_length", "shape_area"})
+
+
+def _field_name_type(field) -> tuple[Optional[str], Optional[str]]:
+    """(name, lower-cased type) of a field definition (dict or attribute style)."""
+    get = getattr(field, "get", None)
+    name = get("name") if get else None
+    field_type = get("type") if get else None
+    if name is None:
+        name = getattr(field, "name", None)
+    if field_type is None:
+        field_type = getattr(field, "type", None)
+    return (str(name) if name else None), (str(field_type).lower() if field_type else None)
 
 
 def _get_comparable_fields(layer, extra_ignored: Optional[set[str]] = None) -> list[str]:
-    props = getattr(layer, "properties", None) or {}
+    props = _layer_props(layer) or {}
     fields_meta = getattr(props, "fields", None)
     if fields_meta is None and isinstance(props, dict):
         fields_meta = props.get("fields")
@@ -202,35 +436,20 @@ def _get_comparable_fields(layer, extra_ignored: Optional[set[str]] = None) -> l
     if not fields_meta:
         return []
 
-    ignore_lower = {str(f).lower() for f in (extra_ignored or set())}
-    auto_ignore_lower: set[str] = set()
+    skip = set(_ALWAYS_IGNORED_FIELDS)
+    skip.update(str(f).lower() for f in (extra_ignored or ()))
     for attr in ("objectIdField", "globalIdField", "shapeFieldName", "geometryField"):
         value = getattr(props, attr, None)
         if value is None and isinstance(props, dict):
             value = props.get(attr)
         if value:
-            auto_ignore_lower.add(str(value).lower())
-    auto_ignore_lower.update({"shape", "shape_length", "shape_area"})
-
-    comparable: list[str] = []
-    for field in fields_meta:
-        name = None
-        field_type = None
-        if hasattr(field, "get"):
-            name = field.get("name")
-            field_type = field.get("type")
-        if name is None:
-            name = getattr(field, "name", None)
-        if field_type is None:
-            field_type = getattr(field, "type", None)
-        if not name:
-            continue
-        lname = str(name).lower()
-        if lname in ignore_lower or lname in auto_ignore_lower:
-            continue
-        if field_type and str(field_type).lower() == "esrifieldtypegeometry":
-            continue
-        comparable.append(str(name))
+            skip.add(str(value).lower())
+
+    comparable = [
+        name
+        for name, field_type in map(_field_name_type, fields_meta)
+        if name and name.lower() not in skip and field_type != "esrifieldtypegeometry"
+    ]
 
     if not comparable:
         oid_field = getattr(props, "objectIdField", None)
@@ -243,7 +462,7 @@ def _get_comparable_fields(layer, extra_ignored: Optional[set[str]] = None) -> l
 
 
 def _layer_supports_pagination(layer) -> bool:
-    props = getattr(layer, "properties", None) or {}
+    props = _layer_props(layer) or {}
     for attr in ("supportsPagination", "supportsPaginationOnLayer"):
         value = getattr(props, attr, None)
         if value is None and isinstance(props, dict):
@@ -265,6 +484,17 @@ def _extract_features(feature_set) -> list:
     return features or []
 
 
+def _exceeded_transfer_limit(feature_set) -> bool:
+    """True when the server flagged more matching rows than this page returned."""
+    try:
+        flag = getattr(feature_set, "exceeded_transfer_limit", None)
+        if flag is None and isinstance(feature_set, dict):
+            flag = feature_set.get("exceededTransferLimit")
+        return bool(flag)
+    except Exception:
+        return False
+
+
 def _feature_attributes(feature) -> Optional[dict]:
     attrs = getattr(feature, "attributes", None)
     if attrs is None and isinstance(feature, dict):
@@ -274,7 +504,140 @@ def _feature_attributes(feature) -> Optional[dict]:
     return dict(attrs)
 
 
-def _iter_layer_feature_tuples(layer, field_names: list[str], where: str, chunk_size: int):
+def _iter_pages(layer, query_kwargs: dict, chunk_size: int, offset: int = 0):
+    """Yield feature pages sequentially using resultOffset/resultRecordCount."""
+    while True:
+        fs = layer.query(result_offset=offset, result_record_count=chunk_size, **query_kwargs)
+        features = _extract_features(fs)
+        if not features:
+            return
+        yield features
+        if len(features) < chunk_size and not _exceeded_transfer_limit(fs):
+            return
+        offset += len(features)
+
+
+def _iter_pages_prefetch(layer, query_kwargs: dict, chunk_size: int):
+    """Like `_iter_pages`, but requests the next page while the current one is consumed."""
+
+    def fetch(offset: int) -> tuple[list, bool]:
+        fs = layer.query(result_offset=offset, result_record_count=chunk_size, **query_kwargs)
+        return _extract_features(fs), _exceeded_transfer_limit(fs)
+
+    offset = 0
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(fetch, offset)
+        while True:
+            features, exceeded = pending.result()
+            if not features:
+                return
+            full = len(features) >= chunk_size or exceeded
+            if full:
+                offset += len(features)
+                pending = executor.submit(fetch, offset)
+            yield features
+            if not full:
+                return
+
+
+def _iter_pages_concurrent(layer, query_kwargs: dict, chunk_size: int, concurrency: int):
+    """Yield feature pages in order while keeping up to `concurrency` requests in flight.
+
+    Offsets are planned from an initial count query; if the count is unavailable
+    this degrades to sequential paging. Rows appended after the count are still
+    picked up by continuing sequentially past the planned range. A short page
+    before the end of the planned range (the server capped the page size, or
+    rows were deleted) switches to sequential paging from where it stopped,
+    so the planned offsets never skip rows.
+    """
+    total = _safe_count(layer, query_kwargs.get("where", "1=1"))
+    if total is None:
+        yield from _iter_pages(layer, query_kwargs, chunk_size)
+        return
+
+    kwargs = dict(query_kwargs)
+    # Offset paging is only stable across independent requests with an explicit order.
+    props = _layer_props(layer) or {}
+    oid_field = getattr(props, "objectIdField", None)
+    if oid_field is None and isinstance(props, dict):
+        oid_field = props.get("objectIdField")
+    if oid_field:
+        kwargs.setdefault("order_by_fields", f"{oid_field} ASC")
+
+    def fetch(offset: int) -> tuple[list, bool]:
+        fs = layer.query(result_offset=offset, result_record_count=chunk_size, **kwargs)
+        return _extract_features(fs), _exceeded_transfer_limit(fs)
+
+    offsets = iter(range(0, total, chunk_size))
+    last_full = False
+    resume = None
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = deque((off, executor.submit(fetch, off)) for off in islice(offsets, concurrency))
+        while pending:
+            offset, future = pending.popleft()
+            features, exceeded = future.result()
+            if features:
+                yield features
+            if len(features) < chunk_size and offset + chunk_size < total:
+                # Later planned offsets assumed a full page here; don't trust them
+                for _, later in pending:
+                    later.cancel()
+                resume = (offset + len(features), len(features) or chunk_size)
+                break
+            nxt = next(offsets, None)
+            if nxt is not None:
+                pending.append((nxt, executor.submit(fetch, nxt)))
+            last_full = len(features) >= chunk_size or exceeded
+    if resume is not None:
+        yield from _iter_pages(layer, kwargs, resume[1], offset=resume[0])
+    elif last_full or total == 0:
+        yield from _iter_pages(layer, kwargs, chunk_size, offset=total)
+
+
+def _row_getter(fields: list[str]):
+    """attrs -> tuple of `fields` values; None for keys missing from a sparse payload."""
+    getter = itemgetter(*fields)
+    single = len(fields) == 1
+
+    def get(attrs: dict) -> tuple:
+        try:
+            values = getter(attrs)
+        except KeyError:
+            return tuple(attrs.get(name) for name in fields)
+        return (values,) if single else values
+
+    return get
+
+
+def _max_page_size(layer, standard: bool = False) -> Optional[int]:
+    """Server cap on rows per query (`maxRecordCount`, or `standardMaxRecordCount` for resultType=standard)."""
+    try:
+        props = _layer_props(layer) or {}
+        return int(props.get("standardMaxRecordCount" if standard else "maxRecordCount") or 0) or None
+    except Exception:
+        return None
+
+
+def _bulk_page_size(layer) -> Optional[int]:
+    """`standardMaxRecordCount` when the layer accepts resultType=standard queries."""
+    try:
+        props = _layer_props(layer) or {}
+        caps = props.get("advancedQueryCapabilities") or {}
+        if not caps.get("supportsQueryWithResultType"):
+            return None
+        return int(props.get("standardMaxRecordCount") or 0) or None
+    except Exception:
+        return None
+
+
+def _iter_layer_feature_tuples(
+    layer,
+    field_names: list[str],
+    where: str,
+    chunk_size: int,
+    concurrency: int = 1,
+    bulk: bool = False,
+):
     if not field_names:
         return
     where_clause = (where or "1=1")
@@ -296,22 +659,28 @@ def _iter_layer_feature_tuples(layer, field_names: list[str], where: str, chunk_
         "out_fields": out_fields if out_fields else "*",
         "return_geometry": False,
     }
+    row = _row_getter(clean_fields)
     supports_pagination = _layer_supports_pagination(layer)
     if supports_pagination and chunk_size and chunk_size > 0:
-        offset = 0
-        while True:
-            fs = layer.query(result_offset=offset, result_record_count=chunk_size, **query_kwargs)
-            features = _extract_features(fs)
-            if not features:
-                break
+        # Attribute-only pages can use the much larger "standard" result size
+        bulk_size = _bulk_page_size(layer) if bulk else None
+        if bulk_size and bulk_size > chunk_size:
+            chunk_size = bulk_size
+            query_kwargs["resultType"] = "standard"
+        # Pages larger than the server cap come back short, which would skip rows
+        page_cap = _max_page_size(layer, query_kwargs.get("resultType") == "standard")
+        if page_cap and page_cap < chunk_size:
+            chunk_size = page_cap
+        if concurrency and concurrency > 1:
+            pages = _iter_pages_concurrent(layer, query_kwargs, chunk_size, concurrency)
+        else:
+            pages = _iter_pages_prefetch(layer, query_kwargs, chunk_size)
+        for features in pages:
             for feat in features:
                 attrs = _feature_attributes(feat)
                 if attrs is None:
                     continue
-                yield tuple(attrs.get(name) for name in clean_fields)
-            if len(features) < chunk_size:
-                break
-            offset += len(features)
+                yield row(attrs)
     else:
         fs = layer.query(return_all_records=True, **query_kwargs)
         features = _extract_features(fs)
@@ -321,28 +690,125 @@ def _iter_layer_feature_tuples(layer, field_names: list[str], where: str, chunk_
             attrs = _feature_attributes(feat)
             if attrs is None:
                 continue
-            yield tuple(attrs.get(name) for name in clean_fields)
+            yield row(attrs)
+
+
+def _build_feature_counter(
+    layer,
+    canonical_order: list[str],
+    field_map: dict[str, str],
+    where: str,
+    chunk_size: int,
+    concurrency: int = 1,
+    bulk: bool = False,
+) -> Counter:
+    actual_fields = [field_map[name] for name in canonical_order]
+    return _count_rows(_iter_layer_feature_tuples(layer, actual_fields, where, chunk_size, concurrency, bulk))
 
 
-def _build_feature_counter(layer, canonical_order: list[str], field_map: dict[str, str], where: str, chunk_size: int) -> Counter:
-    actual_fields = [field_map[name] for name in canonical_order]
+def _count_rows(rows) -> Counter:
     counter: Counter = Counter()
-    for values in _iter_layer_feature_tuples(layer, actual_fields, where, chunk_size):
+    for values in rows:
         counter[values] += 1
     return counter
 
 
+_OID_BATCH = 1000
+
+
+def _object_id_field(layer) -> Optional[str]:
+    props = _layer_props(layer) or {}
+    oid_field = getattr(props, "objectIdField", None)
+    if oid_field is None and isinstance(props, dict):
+        oid_field = props.get("objectIdField")
+    return str(oid_field) if oid_field else None
+
+
+def _query_object_ids(layer, where: str) -> Optional[set]:
+    """ObjectIDs matching `where`, or None when the layer can't answer an ids-only query."""
+    try:
+        res = layer.query(where=where or "1=1", return_ids_only=True)
+    except Exception:
+        return None
+    if not isinstance(res, dict):
+        return None
+    ids = res.get("objectIds")
+    if ids is None and "objectIdFieldName" not in res:
+        return None
+    return set(ids or ())
+
+
+def _build_counter_for_ids(
+    layer,
+    canonical_order: list[str],
+    field_map: dict[str, str],
+    where: str,
+    oid_field: str,
+    ids: set,
+) -> Counter:
+    actual_fields = [field_map[name] for name in canonical_order]
+
+    def rows():
+        ordered = sorted(ids)
+        for start in range(0, len(ordered), _OID_BATCH):
+            clause = f"{oid_field} IN ({','.join(map(str, ordered[start:start + _OID_BATCH]))})"
+            if where and where != "1=1":
+                clause = f"({where}) AND {clause}"
+            yield from _iter_layer_feature_tuples(layer, actual_fields, clause, 0)
+
+    return _count_rows(rows())
+
+
+def _oid_fast_counters(
+    host_layer,
+    guest_layer,
+    canonical_order: list[str],
+    host_field_map: dict[str, str],
+    guest_field_map: dict[str, str],
+    where: str,
+) -> Optional[tuple[Counter, Counter, int]]:
+    """Counters for rows whose ObjectID exists on only one side, plus the shared-ID count.
+
+    Rows sharing an ObjectID are assumed identical and never downloaded. Returns
+    None (full scan needed) when either side lacks ids or the id sets barely
+    overlap, i.e. the two sides number their rows independently.
+    """
+    host_oid = _object_id_field(host_layer)
+    guest_oid = _object_id_field(guest_layer)
+    if not host_oid or not guest_oid:
+        return None
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        host_ids_future = executor.submit(_query_object_ids, host_layer, where)
+        guest_ids_future = executor.submit(_query_object_ids, guest_layer, where)
+        host_ids, guest_ids = host_ids_future.result(), guest_ids_future.result()
+        if host_ids is None or guest_ids is None:
+            return None
+        shared = host_ids & guest_ids
+        if len(shared) * 2 < min(len(host_ids), len(guest_ids)):
+            return None
+        host_future = executor.submit(
+            _build_counter_for_ids, host_layer, canonical_order, host_field_map, where, host_oid, host_ids - shared
+        )
+        guest_future = executor.submit(
+            _build_counter_for_ids, guest_layer, canonical_order, guest_field_map, where, guest_oid, guest_ids - shared
+        )
+        return host_future.result(), guest_future.result(), len(shared)
+
+
 def _counter_delta(host_counter: Counter, guest_counter: Counter, field_names: list[str]) -> tuple[list[dict], list[dict]]:
+    # Two ordered passes keep host/guest rows in their query order
     host_only: list[dict] = []
     guest_only: list[dict] = []
+    host_get = host_counter.get
+    guest_get = guest_counter.get
     for key, host_count in host_counter.items():
-        guest_count = guest_counter.get(key, 0)
-        if host_count > guest_count:
-            host_only.append({"count": host_count - guest_count, "attributes": dict(zip(field_names, key))})
+        delta = host_count - guest_get(key, 0)
+        if delta > 0:
+            host_only.append({"count": delta, "attributes": dict(zip(field_names, key))})
     for key, guest_count in guest_counter.items():
-        host_count = host_counter.get(key, 0)
-        if guest_count > host_count:
-            guest_only.append({"count": guest_count - host_count, "attributes": dict(zip(field_names, key))})
+        delta = guest_count - host_get(key, 0)
+        if delta > 0:
+            guest_only.append({"count": delta, "attributes": dict(zip(field_names, key))})
     return host_only, guest_only
 
 
@@ -356,9 +822,24 @@ def compare_feature_service_records(
     ignore_fields: Optional[list[str]] = None,
     layer_keys: Optional[list[str]] = None,
     chunk_size: int = 2000,
+    concurrency: int = 1,
+    max_workers: int = 1,
+    use_oid_fast_path: bool = False,
+    bulk_pagination: bool = True,
     verbose: bool = True,
 ) -> dict:
-    """Compare record-level differences between two hosted feature service items."""
+    """Compare record-level differences between two hosted feature service items.
+
+    Host and guest rows for a layer are fetched concurrently. With
+    `concurrency` > 1, paginated layers fetch up to that many pages in
+    parallel (planned from an initial count query); with `max_workers` > 1,
+    that many layers/tables are compared at once.
+    With `use_oid_fast_path`, only rows whose ObjectID exists on one side are
+    downloaded; rows sharing an ObjectID are assumed equal (layers whose ids
+    don't line up fall back to the full scan).
+    With `bulk_pagination`, layers advertising resultType support are paged
+    at their `standardMaxRecordCount` when that exceeds `chunk_size`.
+    """
     logger = mylog.get_logger(__name__)
 
     host_item = host_gis.content.get(host_item_id)
@@ -391,6 +872,14 @@ def compare_feature_service_records(
         chunk_size_val = 0
     if chunk_size_val < 0:
         chunk_size_val = 0
+    try:
+        concurrency_val = max(1, int(concurrency))
+    except (TypeError, ValueError):
+        concurrency_val = 1
+    try:
+        layer_workers = max(1, int(max_workers))
+    except (TypeError, ValueError):
+        layer_workers = 1
 
     host_map = _map_flc_by_key(host_flc)
     guest_map = _map_flc_by_key(guest_flc)
@@ -398,126 +887,150 @@ def compare_feature_service_records(
     def allow_key(key: str) -> bool:
         return not layer_key_filter or key.lower() in layer_key_filter
 
-    def compare_collection(kind: str) -> list[dict]:
-        results: list[dict] = []
-        host_objs = host_map.get(kind, {})
-        guest_objs = guest_map.get(kind, {})
-        for key, host_layer in host_objs.items():
-            if not allow_key(key):
-                continue
-            guest_layer = guest_objs.get(key)
-            entry = {
+    def compare_pair(kind: str, key: str, host_layer, guest_layer) -> dict:
+        if host_layer is None:
+            return {
                 "kind": kind,
                 "key": key,
-                "name": getattr(getattr(host_layer, "properties", {}), "get", lambda *_, **__: None)("name")
-                or getattr(host_layer, "name", key),
+                "name": _layer_display_name(guest_layer, key),
+                "status": "missing_on_host",
+                "host_count": None,
+                "guest_count": _safe_count(guest_layer),
+                "host_only": [],
+                "guest_only": [],
             }
-            if guest_layer is None:
-                entry.update({
-                    "status": "missing_on_guest",
-                    "host_count": _safe_count(host_layer),
-                    "guest_count": None,
-                    "host_only": [],
-                    "guest_only": [],
-                })
-                results.append(entry)
-                continue
-
-            host_fields = _get_comparable_fields(host_layer, ignore_fields_set)
-            guest_fields = _get_comparable_fields(guest_layer, ignore_fields_set)
-            guest_lookup = {f.lower(): f for f in guest_fields}
-            fields_info = []
-            missing_on_guest: list[str] = []
-            for host_field in host_fields:
-                guest_field = guest_lookup.get(host_field.lower())
-                if guest_field:
-                    fields_info.append((host_field.lower(), host_field, guest_field))
-                else:
-                    missing_on_guest.append(host_field)
-
-            if missing_on_guest:
-                entry.update({
-                    "status": "error",
-                    "message": "Host fields missing on guest layer",
-                    "missing_fields_on_guest": missing_on_guest,
-                })
-                results.append(entry)
-                continue
+        entry = {
+            "kind": kind,
+            "key": key,
+            "name": _layer_display_name(host_layer, key),
+        }
+        if guest_layer is None:
+            entry.update({
+                "status": "missing_on_guest",
+                "host_count": _safe_count(host_layer),
+                "guest_count": None,
+                "host_only": [],
+                "guest_only": [],
+            })
+            return entry
+
+        host_fields = _get_comparable_fields(host_layer, ignore_fields_set)
+        guest_fields = _get_comparable_fields(guest_layer, ignore_fields_set)
+        guest_lookup = {f.lower(): f for f in guest_fields}
+        fields_info = []
+        missing_on_guest: list[str] = []
+        for host_field in host_fields:
+            guest_field = guest_lookup.get(host_field.lower())
+            if guest_field:
+                fields_info.append((host_field.lower(), host_field, guest_field))
+            else:
+                missing_on_guest.append(host_field)
+
+        if missing_on_guest:
+            entry.update({
+                "status": "error",
+                "message": "Host fields missing on guest layer",
+                "missing_fields_on_guest": missing_on_guest,
+            })
+            return entry
 
-            if not fields_info:
-                entry.update({
-                    "status": "skipped",
-                    "message": "No comparable fields available after filtering",
-                    "host_count": _safe_count(host_layer),
-                    "guest_count": _safe_count(guest_layer),
-                    "host_only": [],
-                    "guest_only": [],
-                })
-                results.append(entry)
-                continue
+        if not fields_info:
+            entry.update({
+                "status": "skipped",
+                "message": "No comparable fields available after filtering",
+                "host_count": _safe_count(host_layer),
+                "guest_count": _safe_count(guest_layer),
+                "host_only": [],
+                "guest_only": [],
+            })
+            return entry
 
-            field_order = [info[0] for info in fields_info]
-            host_field_map = {info[0]: info[1] for info in fields_info}
-            guest_field_map = {info[0]: info[2] for info in fields_info}
-            result_field_names = [host_field_map[name] for name in field_order]
+        field_order = [info[0] for info in fields_info]
+        host_field_map = {info[0]: info[1] for info in fields_info}
+        guest_field_map = {info[0]: info[2] for info in fields_info}
+        result_field_names = [host_field_map[name] for name in field_order]
 
+        fast = None
+        if use_oid_fast_path:
             try:
-                host_counter = _build_feature_counter(host_layer, field_order, host_field_map, where_clause, chunk_size_val)
-            except Exception as exc:
-                entry.update({
-                    "status": "error",
-                    "message": f"Failed to query host layer: {exc}",
-                })
-                results.append(entry)
-                continue
+                fast = _oid_fast_counters(
+                    host_layer, guest_layer, field_order, host_field_map, guest_field_map, where_clause
+                )
+            except Exception:
+                fast = None  # fall back to the full scan
+        if fast is not None:
+            host_counter, guest_counter, shared_count = fast
+        else:
+            shared_count = 0
+            # Host and guest rows come from different portals; fetch both sides at once
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                host_future = executor.submit(
+                    _build_feature_counter,
+                    host_layer, field_order, host_field_map, where_clause, chunk_size_val, concurrency_val,
+                    bulk_pagination,
+                )
+                guest_future = executor.submit(
+                    _build_feature_counter,
+                    guest_layer, field_order, guest_field_map, where_clause, chunk_size_val, concurrency_val,
+                    bulk_pagination,
+                )
+                try:
+                    host_counter = host_future.result()
+                except Exception as exc:
+                    entry.update({
+                        "status": "error",
+                        "message": f"Failed to query host layer: {exc}",
+                    })
+                    return entry
+
+                try:
+                    guest_counter = guest_future.result()
+                except Exception as exc:
+                    entry.update({
+                        "status": "error",
+                        "message": f"Failed to query guest layer: {exc}",
+                    })
+                    return entry
+
+        host_only, guest_only = _counter_delta(host_counter, guest_counter, result_field_names)
+        entry.update({
+            "status": "ok" if not host_only and not guest_only else "mismatch",
+            "fields_compared": result_field_names,
+            "host_count": shared_count + sum(host_counter.values()),
+            "guest_count": shared_count + sum(guest_counter.values()),
+            "host_only": host_only,
+            "guest_only": guest_only,
+        })
+        if fast is not None:
+            entry["oid_fast_path"] = True
+        if where_clause and where_clause != "1=1":
+            entry["where"] = where_clause
+        if ignore_fields_set:
+            entry["ignored_fields"] = sorted(ignore_fields_set)
+        return entry
 
-            try:
-                guest_counter = _build_feature_counter(guest_layer, field_order, guest_field_map, where_clause, chunk_size_val)
-            except Exception as exc:
-                entry.update({
-                    "status": "error",
-                    "message": f"Failed to query guest layer: {exc}",
-                })
-                results.append(entry)
-                continue
 
-            host_only, guest_only = _counter_delta(host_counter, guest_counter, result_field_names)
-            entry.update({
-                "status": "ok" if not host_only and not guest_only else "mismatch",
-                "fields_compared": result_field_names,
-                "host_count": sum(host_counter.values()),
-                "guest_count": sum(guest_counter.values()),
-                "host_only": host_only,
-                "guest_only": guest_only,
-            })
-            if where_clause and where_clause != "1=1":
-                entry["where"] = where_clause
-            if ignore_fields_set:
-                entry["ignored_fields"] = sorted(ignore_fields_set)
-            results.append(entry)
-
-        for key, guest_layer in guest_objs.items():
-            if key in host_objs or not allow_key(key):
-                continue
-            entry = {
-                "kind": kind,
-                "key": key,
-                "name": getattr(getattr(guest_layer, "properties", {}), "get", lambda *_, **__: None)("name")
-                or getattr(guest_layer, "name", key),
-                "status": "missing_on_host",
-                "host_count": None,
-                "guest_count": _safe_count(guest_layer),
-                "host_only": [],
-                "guest_only": [],
-            }
-            results.append(entry)
-        return results
+    def compare_collection(kind: str) -> list[dict]:
+        host_objs = host_map.get(kind, {})
+        guest_objs = guest_map.get(kind, {})
+        # Host keys in host order, then guest-only keys in guest order
+        extra = guest_objs.keys() - host_objs.keys()
+        keys = [key for key in host_objs if allow_key(key)]
+        keys += [key for key in guest_objs if key in extra and allow_key(key)]
+
+        def compare_key(key: str) -> dict:
+            return compare_pair(kind, key, host_objs.get(key), guest_objs.get(key))
+
+        if layer_workers > 1 and len(keys) > 1:
+            with ThreadPoolExecutor(max_workers=min(layer_workers, len(keys))) as executor:
+                return list(executor.map(compare_key, keys))
+        return [compare_key(key) for key in keys]
 
     layer_results = compare_collection("layers")
     table_results = compare_collection("tables")
-    statuses = [entry.get("status") for entry in layer_results + table_results]
-    has_error = any(status == "error" for status in statuses)
-    has_mismatch = any(status in {"mismatch", "missing_on_guest", "missing_on_host"} for status in statuses)
+    statuses = {entry.get("status") for entry in chain(layer_results, table_results)}
+    has_error = "error" in statuses
+    has_mismatch = not statuses.isdisjoint(("mismatch", "missing_on_guest", "missing_on_host"))
     overall_status = "error" if has_error else ("mismatch" if has_mismatch else "ok")
 
     result = {
@@ -537,9 +1050,11 @@ def compare_feature_service_records(
     if layer_keys:
         result["layer_keys"] = list(layer_keys)
 
-    if verbose:
+    if verbose and logger.isEnabledFor(logging.INFO):
         logger.info(
             "Compared service records '%s' -> status: %s",
+            result["title"],
+            result["status"],
             extra={"title": result["title"], "status": result["status"]},
         )
 
@@ -567,6 +1082,9 @@ def _extract_origin_host_id(item) -> Optional[str]:
     return None
 
 
+_GROUP_MAX_ITEMS = 10000
+
+
 def pair_items_in_groups(
     host_gis: GIS,
     guest_gis: GIS,
@@ -581,40 +1099,57 @@ def pair_items_in_groups(
     1) guest item's origin/source item id equals host item id
     2) title + type match (optionally restricted to Feature Service)
     """
-    host_group = host_gis.groups.get(host_group_id)
-    guest_group = guest_gis.groups.get(guest_group_id)
-    if not host_group or not guest_group:
-        return []
-
-    def list_group_items(g):
+    def list_group_items(gis, group_id: str):
+        group = gis.groups.get(group_id)
+        if not group:
+            return None
+        try:
+            # Group.content() stops at a small default page limit
+            return group.content(max_items=_GROUP_MAX_ITEMS)
+        except TypeError:  # older arcgis without max_items
+            pass
+        except Exception:
+            return []
         try:
-            return g.content()
+            return group.content()
         except Exception:
             return []
 
-    host_items = list_group_items(host_group) or []
-    guest_items = list_group_items(guest_group) or []
+    # The listings come from two different portals; fetch them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        host_future = executor.submit(list_group_items, host_gis, host_group_id)
+        guest_future = executor.submit(list_group_items, guest_gis, guest_group_id)
+        host_listing, guest_listing = host_future.result(), guest_future.result()
+    if host_listing is None or guest_listing is None:
+        return []
+
+    def keyed(items) -> list[tuple]:
+        """(item, (title, type)) per item, reading each attribute once."""
+        out = []
+        for item in items:
+            typ = getattr(item, "type", "") or ""
+            if strict_type and typ != "Feature Service":
+                continue
+            out.append((item, (getattr(item, "title", "") or "", typ)))
+        return out
 
-    if strict_type:
-        host_items = [i for i in host_items if getattr(i, "type", "") == "Feature Service"]
-        guest_items = [i for i in guest_items if getattr(i, "type", "") == "Feature Service"]
+    host_items = keyed(host_listing or [])
+    guest_items = keyed(guest_listing or [])
 
-    # Map guest items by origin id and by (title,type)
-    guest_by_origin: dict[str, object] = {}
-    guest_by_key: dict[tuple[str, str], object] = {}
-    for gi in guest_items:
+    # One index for both match rules: origin ids are str keys, (title, type) are tuple keys
+    guest_index: dict[object, object] = {}
+    for gi, key in guest_items:
         oid = _extract_origin_host_id(gi)
         if oid:
-            guest_by_origin[str(oid)] = gi
-        key = (getattr(gi, "title", "") or "", getattr(gi, "type", "") or "")
-        guest_by_key[key] = gi
+            guest_index[str(oid)] = gi
+        guest_index[key] = gi
 
     pairs: list[tuple] = []
-    for hi in host_items:
-        gi = guest_by_origin.get(hi.id)
+    get = guest_index.get
+    for hi, key in host_items:
+        gi = get(hi.id)
         if gi is None:
-            key = (getattr(hi, "title", "") or "", getattr(hi, "type", "") or "")
-            gi = guest_by_key.get(key)
+            gi = get(key)
         if gi is not None:
             pairs.append((hi, gi))
     return pairs
@@ -627,22 +1162,48 @@ def check_collaboration_groups(
     host_group_id: str,
     guest_group_id: str,
     verbose: bool = True,
+    deep: bool = True,
+    max_workers: Optional[int] = None,
+    pair_workers: int = 8,
 ) -> list[dict]:
     """Compare all matched Feature Service items shared between two collaboration groups.
 
-    Returns a list of comparison result dicts (one per matched item pair).
+    Up to `pair_workers` item pairs are compared at once; `deep` and
+    `max_workers` are passed to `compare_feature_service_items`. Without an
+    explicit `max_workers`, concurrent pairs split a budget of 32 count threads.
+    Returns a list of comparison result dicts (one per matched item pair, in pairing order).
     """
     logger = mylog.get_logger(__name__)
     pairs = pair_items_in_groups(host_gis, guest_gis, host_group_id, guest_group_id)
-    if verbose:
+    if verbose and logger.isEnabledFor(logging.INFO):
         logger.info(
             "Matched %d item pairs between groups",
+            len(pairs),
             extra={"count": len(pairs), "host_group": host_group_id, "guest_group": guest_group_id},
         )
-    results: list[dict] = []
-    for hi, gi in pairs:
-        res = compare_feature_service_items(host_gis, guest_gis, hi.id, gi.id, verbose=verbose)
-        results.append(res)
-    return results
+
+    workers = max(1, min(int(pair_workers or 1), len(pairs)))
+    # Nested pools multiply: keep pairs x count threads near a single pool's default
+    count_workers = max_workers or (max(2, 32 // workers) if workers > 1 else None)
+
+    def compare(pair) -> dict:
+        hi, gi = pair
+        # Group listings already return full items; no need to look them up again
+        return compare_feature_service_items(
+            host_gis,
+            guest_gis,
+            hi.id,
+            gi.id,
+            verbose=verbose,
+            deep=deep,
+            max_workers=count_workers,
+            host_item=hi,
+            guest_item=gi,
+        )
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(compare, pairs))
+    return [compare(pair) for pair in pairs]
 
 
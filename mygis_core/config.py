@@ -1,4 +1,5 @@
 import configparser
+import copy
 import json
 import os
 from dataclasses import dataclass
@@ -131,6 +132,73 @@ def _find_first(paths: Iterable[str]) -> Optional[Path]:
     return None
 
 
+_DEFAULT_SEARCH_ORDER = (
+    "mygis.toml",
+    "mygis.yaml",
+    "mygis.yml",
+    "mygis.json",
+    "mygis.ini",
+    ".env",
+)
+
+
+def _find_default() -> Optional[Path]:
+    """First default config file in the cwd, from one directory listing instead of a stat per name."""
+    # Match the case-insensitive lookup Path.exists() gets on Windows
+    fold = str.lower if os.name == "nt" else str
+    wanted = {fold(n) for n in _DEFAULT_SEARCH_ORDER}
+    present: Dict[str, str] = {}
+    try:
+        with os.scandir(".") as entries:
+            for entry in entries:
+                name = fold(entry.name)
+                if name in wanted and entry.is_file():
+                    present[name] = entry.name
+    except OSError:
+        return None
+    for name in _DEFAULT_SEARCH_ORDER:
+        if fold(name) in present:
+            return Path(present[fold(name)])
+    return None
+
+
+# Parsed config files keyed by (path, mtime_ns, size), so a changed file is reparsed
+_PARSED_CACHE: Dict[tuple, Any] = {}
+_PARSED_CACHE_MAX = 8
+
+
+def clear_config_cache() -> None:
+    """Drop cached parsed config files (they are otherwise reparsed only when changed)."""
+    _PARSED_CACHE.clear()
+
+
+def _parse_file(path: Path) -> Any:
+    suffix = path.suffix.lower()
+    if suffix == ".toml":
+        return _read_toml(path)
+    if suffix in {".yaml", ".yml"}:
+        return _read_yaml(path)
+    if suffix == ".json":
+        return _read_json(path)
+    if suffix == ".ini":
+        return _read_ini(path)
+    return _read_env_file(path)  # .env
+
+
+def _read_config_file(path: Path) -> Any:
+    """Parsed contents of `path`, reused while its mtime and size are unchanged."""
+    st = path.stat()
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    data = _PARSED_CACHE.get(key)
+    if data is None:
+        data = _parse_file(path)
+        if len(_PARSED_CACHE) >= _PARSED_CACHE_MAX:
+            _PARSED_CACHE.pop(next(iter(_PARSED_CACHE)))
+        _PARSED_CACHE[key] = data
+    # load_config merges into what it gets back; keep the cached copy pristine
+    return copy.deepcopy(data)
+
+
 def load_config(
     *,
     defaults: Optional[Dict[str, Any]] = None,
@@ -144,33 +212,16 @@ def load_config(
       mygis.json, mygis.ini, .env
     - Environment variables with the given prefix override file values.
     - Types are coerced based on provided defaults when possible.
+    - The config file is re-stat'ed on every call and reparsed only when its
+      mtime or size changed; see `clear_config_cache()`.
     """
     cfg: Dict[str, Any] = dict(defaults or {})
 
-    search_order = paths or (
-        "mygis.toml",
-        "mygis.yaml",
-        "mygis.yml",
-        "mygis.json",
-        "mygis.ini",
-        ".env",
-    )
-
-    found = _find_first(search_order)
+    found = _find_first(paths) if paths else _find_default()
     file_data: dict = {}
     if found:
-        suffix = found.suffix.lower()
         try:
-            if suffix == ".toml":
-                file_data = _read_toml(found)
-            elif suffix in {".yaml", ".yml"}:
-                file_data = _read_yaml(found)
-            elif suffix == ".json":
-                file_data = _read_json(found)
-            elif suffix == ".ini":
-                file_data = _read_ini(found)
-            else:  # .env
-                file_data = _read_env_file(found)
+            file_data = _read_config_file(found)
         except Exception:
             # Fail soft: leave file_data empty
             file_data = {}
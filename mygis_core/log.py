@@ -1,18 +1,79 @@
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
-from typing import Optional
+import threading
+from typing import Optional, TextIO
+
+try:  # optional: faster JSON log lines
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+# C-accelerated string encoder json.dumps(..., ensure_ascii=False) uses
+_encode_str = json.encoder.encode_basestring
 
 _CONFIGURED = False
+# Serializes configure_logging so concurrent first get_logger() calls install handlers once
+_CONFIG_LOCK = threading.Lock()
+# Background writer when logging is queued (see configure_logging(queued=...))
+_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+# Standard LogRecord attributes; anything else on a record came from `extra=`
+_RECORD_ATTRS = frozenset({
+    "name",
+    "msg",
+    "args",
+    "levelname",
+    "levelno",
+    "pathname",
+    "filename",
+    "module",
+    "exc_info",
+    "exc_text",
+    "stack_info",
+    "lineno",
+    "funcName",
+    "created",
+    "msecs",
+    "relativeCreated",
+    "thread",
+    "threadName",
+    "processName",
+    "process",
+})
+
+
+# Keys JsonFormatter writes itself, ahead of any `extra=` fields
+_JSON_FIXED_KEYS = frozenset({"level", "name", "message", "exc_info"})
 
 
 class JsonFormatter(logging.Formatter):
     def __init__(self, *, default_fields=None):
         super().__init__()
         self.default_fields = default_fields or {}
+        # Without orjson, lines are assembled from fragments encoded up front instead of
+        # running json.dumps over a fresh dict per record (None: use the generic path)
+        self._head = None if orjson is not None else self._encode_head(self.default_fields)
+        self._skip = _RECORD_ATTRS | _JSON_FIXED_KEYS | self.default_fields.keys()
+
+    @staticmethod
+    def _encode_head(fields) -> Optional[str]:
+        if _JSON_FIXED_KEYS & fields.keys() or not all(isinstance(k, str) for k in fields):
+            return None  # overridden built-in keys / key coercion: leave it to json.dumps
+        try:
+            return "{" + "".join(
+                f"{_encode_str(k)}: {json.dumps(v, ensure_ascii=False)}, " for k, v in fields.items()
+            )
+        except (TypeError, ValueError):
+            return None
 
     def format(self, record: logging.LogRecord) -> str:
+        if self._head is not None:
+            return self._format_compiled(record)
         data = {
             **self.default_fields,
             "level": record.levelname,
@@ -23,32 +84,53 @@ class JsonFormatter(logging.Formatter):
             data["exc_info"] = self.formatException(record.exc_info)
         # Merge extra fields (those not in LogRecord default attrs)
         for k, v in record.__dict__.items():
-            if k in (
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-            ):
-                continue
-            data.setdefault(k, v)
+            if k not in _RECORD_ATTRS:
+                data.setdefault(k, v)
+        if orjson is not None:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+            except TypeError:  # value orjson can't encode; let json report/handle it
+                pass
         return json.dumps(data, ensure_ascii=False)
 
+    def _format_compiled(self, record: logging.LogRecord) -> str:
+        # Same text json.dumps(data, ensure_ascii=False) gives for the dict built in format()
+        parts = [
+            f'{self._head}"level": {_encode_str(record.levelname)}, '
+            f'"name": {_encode_str(record.name)}, "message": {_encode_str(record.getMessage())}'
+        ]
+        if record.exc_info:
+            parts.append(f', "exc_info": {_encode_str(self.formatException(record.exc_info))}')
+        skip = self._skip
+        for k, v in record.__dict__.items():
+            if k not in skip:
+                parts.append(f", {_encode_str(k)}: {json.dumps(v, ensure_ascii=False)}")
+        parts.append("}")
+        return "".join(parts)
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for an in-process listener: resolves the message now, keeps exc_info."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _stop_listener() -> None:
+    """Drain queued records and close the handlers behind the listener."""
+    global _LISTENER
+    listener, _LISTENER = _LISTENER, None
+    if listener is None:
+        return
+    listener.stop()
+    for h in listener.handlers:
+        h.close()
+
+
+atexit.register(_stop_listener)
+
 
 def _env_bool(name: str, default: bool = False) -> bool:
     val = os.getenv(name)
@@ -74,59 +156,73 @@ def configure_logging(
     fmt: Optional[str] = None,
     datefmt: Optional[str] = None,
     reset: bool = False,
+    queued: Optional[bool] = None,
+    stream: Optional[TextIO] = None,
 ) -> None:
     """Configure root logging.
 
     Precedence: explicit args > env vars > defaults.
+    Console output goes to `stream` (default stdout).
 
     Env vars:
     - MYGIS_LOG_LEVEL: e.g. DEBUG, INFO, WARNING
     - MYGIS_LOG_FORMAT: json|plain
     - MYGIS_LOG_FILE: path to log file (optional)
+    - MYGIS_LOG_QUEUE: 1/true to write log output from a background thread
+      (callers only enqueue; lines may then interleave late with print output)
     """
-    global _CONFIGURED
-
-    if reset:
-        for h in logging.root.handlers[:]:
-            logging.root.removeHandler(h)
-        _CONFIGURED = False
-
-    if _CONFIGURED:
-        return
-
-    level = _coerce_level(level or os.getenv("MYGIS_LOG_LEVEL"))
-    log_format_env = os.getenv("MYGIS_LOG_FORMAT", "plain").lower()
-    json_format = json_format if json_format is not None else (log_format_env == "json")
-    file = file if file is not None else os.getenv("MYGIS_LOG_FILE")
-
-    handlers: list[logging.Handler] = []
-    stream = logging.StreamHandler(stream=sys.stdout)
-    if json_format:
-        stream.setFormatter(JsonFormatter())
-    else:
-        stream.setFormatter(
-            logging.Formatter(
-                fmt or "%(levelname)s %(name)s: %(message)s",
-                datefmt or "%Y-%m-%d %H:%M:%S",
-            )
-        )
-    handlers.append(stream)
-
-    if file:
-        fh = logging.FileHandler(file)
+    global _CONFIGURED, _LISTENER
+
+    with _CONFIG_LOCK:
+        if reset:
+            for h in logging.root.handlers[:]:
+                logging.root.removeHandler(h)
+                h.close()  # release log files; stream handlers leave stdout open
+            _stop_listener()
+            _CONFIGURED = False
+
+        if _CONFIGURED:
+            return
+
+        level = _coerce_level(level or os.getenv("MYGIS_LOG_LEVEL"))
+        log_format_env = os.getenv("MYGIS_LOG_FORMAT", "plain").lower()
+        json_format = json_format if json_format is not None else (log_format_env == "json")
+        file = file if file is not None else os.getenv("MYGIS_LOG_FILE")
+
+        handlers: list[logging.Handler] = []
+        console = logging.StreamHandler(stream=stream or sys.stdout)
         if json_format:
-            fh.setFormatter(JsonFormatter())
+            console.setFormatter(JsonFormatter())
         else:
-            fh.setFormatter(
+            console.setFormatter(
                 logging.Formatter(
-                    fmt or "%(asctime)s %(levelname)s %(name)s: %(message)s",
+                    fmt or "%(levelname)s %(name)s: %(message)s",
                     datefmt or "%Y-%m-%d %H:%M:%S",
                 )
             )
-        handlers.append(fh)
+        handlers.append(console)
+
+        if file:
+            fh = logging.FileHandler(file)
+            if json_format:
+                fh.setFormatter(JsonFormatter())
+            else:
+                fh.setFormatter(
+                    logging.Formatter(
+                        fmt or "%(asctime)s %(levelname)s %(name)s: %(message)s",
+                        datefmt or "%Y-%m-%d %H:%M:%S",
+                    )
+                )
+            handlers.append(fh)
+
+        if queued if queued is not None else _env_bool("MYGIS_LOG_QUEUE"):
+            q: queue.SimpleQueue = queue.SimpleQueue()
+            _LISTENER = logging.handlers.QueueListener(q, *handlers, respect_handler_level=True)
+            _LISTENER.start()
+            handlers = [_LocalQueueHandler(q)]
 
-    logging.basicConfig(level=level, handlers=handlers)
-    _CONFIGURED = True
+        logging.basicConfig(level=level, handlers=handlers)
+        _CONFIGURED = True
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
@@ -1,16 +1,24 @@
 from __future__ import annotations
-from datetime import datetime
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import logging
+from typing import Iterable, Iterator, Optional
 import re
+import time
 from arcgis.features import FeatureLayerCollection
 from arcgis.gis import GIS
 from . import log as mylog
 from . import auth as myauth
 from . import config as myconfig
 
+_FS_ROOT_RE = re.compile(r"(.*?/FeatureServer)(?:/\d+)?$", flags=re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
 def _to_fs_root(url: str) -> str:
     """Ensure we have the FeatureServer root URL (strip trailing layer /0, /1, ...)."""
-    m = re.search(r"(.*?/FeatureServer)(?:/\d+)?$", url, flags=re.IGNORECASE)
+    m = _FS_ROOT_RE.search(url)
     if not m:
         raise ValueError("URL must point to a FeatureServer (service or layer).")
     return m.group(1)
@@ -21,13 +29,42 @@ def _epoch_ms_to_iso(ms):
         return None
     try:
         ms = int(ms)
+    except Exception:
+        return str(ms)
+    return _format_epoch_ms(ms)
+
+
+@lru_cache(maxsize=4096)
+def _format_epoch_ms(ms: int) -> str:
+    # Replicas from one sync batch share timestamps; format each distinct value once
+    try:
         if ms < 10_000_000_000:  # seconds -> ms
             ms *= 1000
-        return datetime.utcfromtimestamp(ms / 1000).strftime("%Y-%m-%d %H:%M:%S UTC")
+        t = time.gmtime(ms // 1000)  # no datetime object or strftime per value
+        if not 1 <= t.tm_year <= 9999:  # outside what datetime could represent
+            return str(ms)
+        return "%04d-%02d-%02d %02d:%02d:%02d UTC" % t[:6]
     except Exception:
         return str(ms)
 
 
+_REPLICA_COLUMNS = (
+    ("id", "replicaID"),
+    ("name", "replicaName"),
+    ("owner", "replicaOwner"),
+    ("type", "replicaType"),
+    ("created", "creationDate"),
+    ("last_sync", "lastSyncDate"),
+    ("state", "replicaState"),
+)
+_TIMESTAMP_FIELDS = frozenset({"creationDate", "lastSyncDate"})
+# (field, default, converter) per column, resolved once instead of per cell
+_REPLICA_CELLS = tuple(
+    (src, None, _epoch_ms_to_iso) if src in _TIMESTAMP_FIELDS else (src, "", str)
+    for _, src in _REPLICA_COLUMNS
+)
+
+
 def list_replicas(service_url_or_itemid: str, *, verbose: bool = True, gis: Optional[GIS] = None):
     """List replicas for a Feature Service (AGOL/Enterprise).
 
@@ -57,42 +94,32 @@ def list_replicas(service_url_or_itemid: str, *, verbose: bool = True, gis: Opti
             print("This service does not have sync enabled; replicas will not exist.")
         return []
 
+    return _replicas_for_flc(flc, verbose=verbose, logger=logger)
+
+
+def _replicas_for_flc(flc, *, verbose: bool, logger) -> list:
+    """Fetch (and optionally log a table of) the replicas of an opened sync-enabled service."""
     # Call the REST replicas resource (GET {FeatureServer}/replicas?f=json)
     res = flc._con.get(f"{flc.url}/replicas", params={"f": "json"})
     replicas = res.get("replicas", []) if isinstance(res, dict) else []
 
-    if verbose and replicas:
-        cols = [
-            ("id", "replicaID"),
-            ("name", "replicaName"),
-            ("owner", "replicaOwner"),
-            ("type", "replicaType"),
-            ("created", "creationDate"),
-            ("last_sync", "lastSyncDate"),
-            ("state", "replicaState"),
-        ]
-
+    if verbose and replicas and logger.isEnabledFor(logging.INFO):
         def row(r):
-            return [
-                str(r.get(src, "")) if src not in ("creationDate", "lastSyncDate")
-                else (_epoch_ms_to_iso(r.get(src)))
-                for _, src in cols
-            ]
-
-        headers = [h for h, _ in cols]
-        widths = [max(len(h), 12) for h in headers]
-        for r in replicas:
-            for i, val in enumerate(row(r)):
-                widths[i] = max(widths[i], len(str(val)))
-
-        def fmt(vals):
-            return "  ".join(str(v).ljust(widths[i]) for i, v in enumerate(vals))
-
-        logger.info(fmt(headers))
-        logger.info(fmt(["-" * w for w in widths]))
-        for r in replicas:
-            logger.info(fmt(row(r)))
-        logger.info(f"Total replicas: {len(replicas)}")
+            return [str(conv(r.get(src, default))) for src, default, conv in _REPLICA_CELLS]
+
+        headers = [h for h, _ in _REPLICA_COLUMNS]
+        rendered = [row(r) for r in replicas]
+        widths = [max(len(h), 12, *(len(vals[i]) for vals in rendered)) for i, h in enumerate(headers)]
+
+        # Pad a whole row in one str.format call instead of an ljust per cell
+        fmt = "  ".join(f"{{:<{w}}}" for w in widths).format
+
+        # One record for the whole table: a single handler write, and concurrent
+        # service sweeps can't interleave their rows
+        lines = [fmt(*headers), fmt(*("-" * w for w in widths))]
+        lines.extend(fmt(*vals) for vals in rendered)
+        lines.append(f"Total replicas: {len(replicas)}")
+        logger.info("Replicas:\n%s", "\n".join(lines))
 
     return replicas
 
@@ -107,8 +134,21 @@ def find_hosted_feature_services(
     """Search for hosted Feature Service items in the portal.
 
     - Default query finds items of type "Feature Service" with hosted keywords.
-    - Returns a list of `Item` objects.
+    - Returns a list of `Item` objects, most recently modified first.
+    - Raises if a result page after the first fails, instead of returning a
+      truncated list.
     """
+    return list(_iter_hosted_feature_services(gis=gis, query=query, max_items=max_items, owner=owner))
+
+
+def _iter_hosted_feature_services(
+    *,
+    gis: Optional[GIS] = None,
+    query: Optional[str] = None,
+    max_items: int = 1000,
+    owner: Optional[str] = None,
+) -> Iterator:
+    """`find_hosted_feature_services`, yielding items page by page as the search returns them."""
     gis_obj = gis or myauth.get_gis()
 
     # Determine owner from param or config
@@ -135,9 +175,161 @@ def find_hosted_feature_services(
         else:
             q = f"{q} AND owner:{o}"
     try:
-        return gis_obj.content.search(q, max_items=max_items)
+        results = _search_items(gis_obj, q, max_items)
     except Exception:
-        return []
+        return  # search unavailable: nothing found, as before
+    # A page failing after the first raises rather than passing off a partial inventory
+    yield from results
+
+
+# Portal search returns at most 100 results per request
+_SEARCH_PAGE = 100
+_SEARCH_WORKERS = 4
+_SEARCH_ORDER = {"sort_field": "modified", "sort_order": "desc"}
+
+
+def _search_items(gis_obj, q: str, max_items: int) -> Iterable:
+    """`content.search` with the result pages after the first fetched concurrently.
+
+    Falls back to a plain `content.search` when `advanced_search` is unavailable
+    or its first response doesn't look like a paged search result.
+    """
+    content = gis_obj.content
+    try:
+        items = _search_pages(gis_obj, content, q, max_items)
+    except Exception:
+        items = None
+    if items is not None:
+        return items
+    try:
+        return content.search(q, max_items=max_items, outside_org=False, **_SEARCH_ORDER)
+    except TypeError:  # older API builds without sort arguments
+        return content.search(q, max_items=max_items)
+
+
+def _search_pages(gis_obj, content, q: str, max_items: int) -> Optional[Iterator]:
+    if max_items <= _SEARCH_PAGE or not hasattr(content, "advanced_search"):
+        return None  # a single request either way
+    # Same org scoping content.search applies for outside_org=False
+    org_id = (getattr(gis_obj, "properties", None) or {}).get("id")
+    if not org_id:
+        return None
+    q = f"{q} accountid:{org_id}"
+
+    first = content.advanced_search(q, max_items=_SEARCH_PAGE, start=1, **_SEARCH_ORDER)
+    limit = min(int(first["total"]), max_items)
+    return _iter_search_pages(content, q, list(first["results"])[:limit], limit)
+
+
+def _iter_search_pages(content, q: str, first: list, limit: int) -> Iterator:
+    yield from first
+    starts = range(1 + _SEARCH_PAGE, limit + 1, _SEARCH_PAGE)
+    if not starts:
+        return
+
+    def page(start: int) -> list:
+        num = min(_SEARCH_PAGE, limit - start + 1)
+        try:
+            res = content.advanced_search(q, max_items=num, start=start, **_SEARCH_ORDER)
+            return list(res["results"])[:num]
+        except Exception as exc:
+            mylog.get_logger(__name__).warning(
+                "Search result page at start=%d failed",
+                start,
+                extra={"start": start, "error": str(exc)},
+            )
+            raise
+
+    executor = ThreadPoolExecutor(max_workers=min(_SEARCH_WORKERS, len(starts)))
+    try:
+        for results in executor.map(page, starts):
+            yield from results
+    finally:
+        # Consumer may stop early; don't fetch pages nobody will read
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _inspect_sync_service(item, verbose: bool, logger) -> Optional[dict]:
+    try:
+        flc = FeatureLayerCollection.fromitem(item)
+        props = flc.properties
+        sync_enabled = getattr(props, "syncEnabled", None)
+        if sync_enabled is not True:
+            return None
+        else:
+            if verbose:
+                logger.info(f"Inspecting service: {getattr(item, 'title', '')} ({item.id})")
+        # Reuse the collection opened above instead of resolving the item again
+        reps = _replicas_for_flc(flc, verbose=verbose, logger=logger)
+        return {
+            "item_id": item.id,
+            "title": getattr(item, "title", ""),
+            "service_url": flc.url,
+            "sync_enabled": True,
+            "replicas": reps,
+        }
+    except Exception as exc:
+        if verbose:
+            logger.warning(
+                "Failed to inspect service",
+                extra={"item_id": getattr(item, "id", None), "error": str(exc)},
+            )
+        return None
+
+
+def iter_replicas_for_sync_enabled_services(
+    *,
+    gis: Optional[GIS] = None,
+    query: Optional[str] = None,
+    owner: Optional[str] = None,
+    max_items: int = 1000,
+    verbose: bool = True,
+    max_workers: int = 16,
+) -> Iterator[dict]:
+    """Yield the `list_replicas_for_sync_enabled_services` dicts one by one.
+
+    Results keep the search order (same as the list variant). Up to
+    `2 * max_workers` services are inspected ahead of the consumer, so output
+    can be streamed while later services are still being inspected.
+    """
+    logger = mylog.get_logger(__name__)
+    # Caller-built GIS objects get the same pooled keep-alive adapter as get_gis()
+    gis_obj = myauth.ensure_pooled(gis) if gis is not None else myauth.get_gis()
+    # Items stream in page by page; inspection starts while later pages are fetched
+    items = _iter_hosted_feature_services(gis=gis_obj, query=query, owner=owner, max_items=max_items)
+
+    count = 0
+    workers = max(1, int(max_workers or 1))
+    if workers > 1:
+        executor = ThreadPoolExecutor(max_workers=workers)
+        # Bounded window of in-flight inspections, drained in submission order
+        pending: deque = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(_inspect_sync_service, item, verbose, logger))
+                if len(pending) < 2 * workers:
+                    continue
+                res = pending.popleft().result()
+                if res is not None:
+                    count += 1
+                    yield res
+            while pending:
+                res = pending.popleft().result()
+                if res is not None:
+                    count += 1
+                    yield res
+        finally:
+            # Consumer may stop early; don't start services nobody will read
+            executor.shutdown(wait=True, cancel_futures=True)
+    else:
+        for item in items:
+            res = _inspect_sync_service(item, verbose, logger)
+            if res is not None:
+                count += 1
+                yield res
+
+    if verbose:
+        logger.info("Sync-enabled hosted services: %d", count, extra={"count": count})
 
 
 def list_replicas_for_sync_enabled_services(
@@ -147,47 +339,36 @@ def list_replicas_for_sync_enabled_services(
     owner: Optional[str] = None,
     max_items: int = 1000,
     verbose: bool = True,
+    max_workers: int = 16,
 ) -> list[dict]:
     """List replicas across all hosted services with sync enabled.
 
+    Services are inspected concurrently on up to `max_workers` threads;
+    results keep the search order.
+
     Returns a list of dicts, each containing:
     - item_id, title, service_url, sync_enabled, replicas (list)
     """
     logger = mylog.get_logger(__name__)
-    gis_obj = gis or myauth.get_gis()
-    items = find_hosted_feature_services(gis=gis_obj, query=query, owner=owner, max_items=max_items)
-    results: list[dict] = []
+    # Caller-built GIS objects get the same pooled keep-alive adapter as get_gis()
+    gis_obj = myauth.ensure_pooled(gis) if gis is not None else myauth.get_gis()
+    # Items stream in page by page; inspection starts while later pages are fetched
+    items = _iter_hosted_feature_services(gis=gis_obj, query=query, owner=owner, max_items=max_items)
 
-    for item in items:
-        try:
-            flc = FeatureLayerCollection.fromitem(item)
-            props = flc.properties
-            sync_enabled = getattr(props, "syncEnabled", None)
-            if sync_enabled is not True:
-                continue
-            else:
-                if verbose:
-                    logger.info(f"Inspecting service: {getattr(item, 'title', '')} ({item.id})")
-            reps = list_replicas(item.id, verbose=verbose, gis=gis_obj)
-            results.append(
-                {
-                    "item_id": item.id,
-                    "title": getattr(item, "title", ""),
-                    "service_url": flc.url,
-                    "sync_enabled": True,
-                    "replicas": reps,
-                }
-            )
-        except Exception as exc:
-            if verbose:
-                logger.warning(
-                    "Failed to inspect service",
-                    extra={"item_id": getattr(item, "id", None), "error": str(exc)},
-                )
-            continue
+    def inspect(item) -> Optional[dict]:
+        return _inspect_sync_service(item, verbose, logger)
+
+    # The pool only spawns threads as work arrives, so small searches stay cheap
+    workers = max(1, int(max_workers or 1))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            inspected = list(executor.map(inspect, items))
+    else:
+        inspected = [inspect(item) for item in items]
+    results: list[dict] = [r for r in inspected if r is not None]
 
     if verbose:
-        logger.info("Sync-enabled hosted services: %d", extra={"count": len(results)})
+        logger.info("Sync-enabled hosted services: %d", len(results), extra={"count": len(results)})
     return results
 
 
@@ -0,0 +1,55 @@
+"""Record paging must not skip rows when the server caps the page size."""
+
+import pytest
+
+pytest.importorskip("arcgis")
+
+from mygis_core import collab  # noqa: E402
+
+
+class CappedLayer:
+    """Fake feature layer that returns at most `max_record_count` rows per query."""
+
+    def __init__(self, total: int, max_record_count: int = 1000, advertise_cap: bool = True):
+        self.rows = [{"OBJECTID": i + 1, "value": i} for i in range(total)]
+        self.max_record_count = max_record_count
+        self.properties = {"supportsPagination": True, "objectIdField": "OBJECTID"}
+        if advertise_cap:
+            self.properties["maxRecordCount"] = max_record_count
+        self.page_sizes: list[int] = []
+
+    def query(self, where="1=1", returnCountOnly=False, result_offset=0, result_record_count=None, **kwargs):
+        if returnCountOnly:
+            return {"count": len(self.rows)}
+        page = min(result_record_count or self.max_record_count, self.max_record_count)
+        self.page_sizes.append(result_record_count)
+        features = [{"attributes": dict(row)} for row in self.rows[result_offset:result_offset + page]]
+        return {
+            "features": features,
+            "exceededTransferLimit": result_offset + len(features) < len(self.rows),
+        }
+
+
+def _values(pages) -> list[int]:
+    return [feat["attributes"]["value"] for page in pages for feat in page]
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_feature_tuples_clamp_chunk_size_to_max_record_count(concurrency):
+    layer = CappedLayer(total=4500, max_record_count=1000)
+    rows = list(collab._iter_layer_feature_tuples(layer, ["value"], "1=1", 2000, concurrency))
+    assert rows == [(i,) for i in range(4500)]
+    assert set(layer.page_sizes) == {1000}
+
+
+def test_concurrent_pages_fall_back_to_sequential_on_short_page():
+    # No advertised maxRecordCount: the short first page is the only signal
+    layer = CappedLayer(total=4500, max_record_count=1000, advertise_cap=False)
+    pages = collab._iter_pages_concurrent(layer, {"where": "1=1"}, 2000, 4)
+    assert _values(pages) == list(range(4500))
+
+
+def test_sequential_pages_follow_exceeded_transfer_limit():
+    layer = CappedLayer(total=2500, max_record_count=1000, advertise_cap=False)
+    pages = collab._iter_pages(layer, {"where": "1=1"}, 2000)
+    assert _values(pages) == list(range(2500))